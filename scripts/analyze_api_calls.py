@@ -3,30 +3,560 @@
 API呼び出し分析スクリプト。LLMとEmbeddingの呼び出し回数と処理時間を抽出する
 """
 
+import contextlib
+import io
+import mmap
+import os
 import re
 import sys
-from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain, repeat
+
+# Hyperscanがあればキーワード検索をDFAで一括走査する
+try:
+    import hyperscan
+
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
 
 # 定数定義
 ERROR_PREFIX = "❌ ファイル処理失敗:"
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 並列解析で1ワーカーに割り当てる最小バイト数（これより小さいログは1プロセスで解析）
+PARALLEL_MIN_RANGE_BYTES = 32 * 1024 * 1024
+
+# 行頭の時刻（HH:MM:SS）
+TIME_PATTERN = re.compile(rb"\d{2}:\d{2}:\d{2}")
+
+# 行頭の時刻とスレッドID・ファイル名を1回の照合で抽出する
+# 例: 02:42:28 [T184][tag_model] - openai._base_client - DEBUG - Sending HTTP Request: POST http://.../chat/completions
+LINE_HEADER_PATTERN = re.compile(
+    rb"(?P<time>\d{2}:\d{2}:\d{2}) "
+    rb"(?:\[T(?P<thread_id>\d+)\]\[(?P<file_name>[^\]]+)\])?"
+)
+
+# HTTPリクエスト/レスポンス行のキーワード
+HTTP_REQUEST_KEYWORD = b"Sending HTTP Request: POST"
+HTTP_RESPONSE_KEYWORD = b"HTTP Response: POST"
+
+# 解析対象となる行に含まれるキーワード。いずれも含まない行はデコードせずに読み飛ばす
+LINE_KEYWORDS = (
+    HTTP_REQUEST_KEYWORD.decode("ascii"),
+    HTTP_RESPONSE_KEYWORD.decode("ascii"),
+    "🔄 Rate limit detected",
+    "⚠️ Graphitiエンティティ競合エラー",
+    "処理ファイル数:",
+    "作成チャンク数:",
+    "登録エピソード数:",
+    "⚠️ 処理失敗ファイル数:",
+    ERROR_PREFIX,
+    "⏱️ パフォーマンス -",
+    "📊 ワーカー数調整",
+    "📈 ファイル統計",
+    "🚀 並列処理モードで実行（ワーカー数:",
+    "⚠️ 大きなファイル検出:",
+    "📄 大きめのファイル:",
+    "📦 一括保存開始（並列）:",
+    "📁 ファイル処理開始:",
+)
+LINE_KEYWORD_BYTES = tuple(keyword.encode("utf-8") for keyword in LINE_KEYWORDS)
+LINE_KEYWORD_PATTERN = re.compile(
+    b"|".join(re.escape(keyword) for keyword in LINE_KEYWORD_BYTES)
+)
+if HAS_HYPERSCAN:
+    # IDはLINE_KEYWORDSの添字。同じ位置で複数一致した場合はreの選択と同じく先頭側を優先する
+    LINE_KEYWORD_DATABASE = hyperscan.Database()
+    LINE_KEYWORD_DATABASE.compile(
+        expressions=[re.escape(keyword) for keyword in LINE_KEYWORD_BYTES],
+        ids=list(range(len(LINE_KEYWORD_BYTES))),
+        flags=[0] * len(LINE_KEYWORD_BYTES),
+    )
+
+
+# 時刻の種類は1日あたり高々86400通りのため、変換結果をキャッシュして再計算を省く
+@lru_cache(maxsize=SECONDS_PER_DAY)
+def parse_time(time_bytes):
+    """HH:MM:SS形式のバイト列をその日の0時からの経過秒数に変換"""
+    # 各桁のASCIIコードから"0"(48)を引いて数値化する
+    hours = (time_bytes[0] - 48) * 10 + (time_bytes[1] - 48)
+    minutes = (time_bytes[3] - 48) * 10 + (time_bytes[4] - 48)
+    seconds = (time_bytes[6] - 48) * 10 + (time_bytes[7] - 48)
+    if hours > 23 or minutes > 59 or seconds > 61:
+        return None
+    return hours * 3600 + minutes * 60 + seconds
 
 
-def parse_time(time_str):
-    """時刻文字列をdatetimeオブジェクトに変換"""
-    try:
-        # HH:MM:SS形式
-        time_obj = datetime.strptime(time_str, "%H:%M:%S")
-        return time_obj
-    except ValueError:
+def elapsed_seconds(start_time, end_time):
+    """開始・終了時刻（経過秒数）から所要時間を算出（日付をまたいだ場合も考慮）"""
+    duration = end_time - start_time
+    if duration < 0:
+        duration += SECONDS_PER_DAY
+    return duration
+
+
+@dataclass
+class RequestStats:
+    """完了したAPIリクエストの所要時間を逐次集計する（リクエストごとの記録は保持しない）"""
+
+    count: int = 0
+    total: float = 0.0
+    max_duration: float = float("-inf")
+    min_duration: float = float("inf")
+    # ファイル名 -> [件数, 合計]（ログへの出現順）
+    per_file: dict = field(default_factory=lambda: defaultdict(lambda: [0, 0.0]))
+
+    def add(self, file_name, duration):
+        """完了したリクエストの所要時間を1件集計"""
+        duration = float(duration)
+        self.count += 1
+        self.total += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.min_duration = min(self.min_duration, duration)
+        stats = self.per_file[file_name]
+        stats[0] += 1
+        stats[1] += duration
+
+    def __len__(self):
+        return self.count
+
+
+def open_log_buffer(f):
+    """ログファイルを読み取り専用でmmapする（空ファイルはmmapできないため空bytesを返す）"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b"")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_keyword_hits(buffer, pos, endpos):
+    """範囲内のキーワード出現を (開始位置, 終了位置, キーワード) として出現順に返す"""
+    if HAS_HYPERSCAN:
+        hits = []
+
+        def on_match(keyword_id, _start, end, _flags, _context):
+            # キーワードは固定文字列のため、開始位置は終了位置と長さから求める
+            hits.append((end - len(LINE_KEYWORD_BYTES[keyword_id]), keyword_id, end))
+
+        LINE_KEYWORD_DATABASE.scan(
+            memoryview(buffer)[pos:endpos], match_event_handler=on_match
+        )
+        # 通知は終了位置順のため、同じ行の中だけ前後しうる。ほぼ整列済みなのでソートは軽い
+        hits.sort()
+        for start, keyword_id, end in hits:
+            yield pos + start, pos + end, LINE_KEYWORD_BYTES[keyword_id]
+        return
+
+    search = LINE_KEYWORD_PATTERN.search
+    while True:
+        keyword_match = search(buffer, pos, endpos)
+        if not keyword_match:
+            return
+        pos = keyword_match.end()
+        yield keyword_match.start(), pos, keyword_match.group()
+
+
+def iter_keyword_lines(buffer, pos=0, endpos=None):
+    """キーワードを含む行の (開始位置, 終了位置, キーワード, キーワード終了位置) を順に返す
+
+    posには行頭を指定する。
+    """
+    if endpos is None:
+        endpos = len(buffer)
+
+    # 行ごとに呼び出すメソッドは、属性参照を避けるためローカル変数に束縛しておく
+    find = buffer.find
+    rfind = buffer.rfind
+    for keyword_start, keyword_end, keyword in iter_keyword_hits(buffer, pos, endpos):
+        # 同じ行の2つ目以降のキーワードは読み飛ばす
+        if keyword_start < pos:
+            continue
+
+        newline = rfind(b"\n", pos, keyword_start)
+        start = newline + 1 if newline >= 0 else pos
+        end = find(b"\n", keyword_end, endpos)
+        if end < 0:
+            end = endpos
+        yield start, end, keyword, keyword_end
+
+        pos = end + 1
+
+
+def classify_http_line(buffer, keyword, keyword_end, end):
+    """HTTP行を (リクエストか, LLMか) に分類する。LLM/Embeddingの行でなければNoneを返す"""
+    if keyword != HTTP_REQUEST_KEYWORD and keyword != HTTP_RESPONSE_KEYWORD:
+        return None
+
+    # 方向はキーワードで決まり、URLはキーワードの後ろにあるため、そこから行末までだけを探す
+    is_request = keyword == HTTP_REQUEST_KEYWORD
+    if buffer.find(b"chat/completions", keyword_end, end) >= 0:
+        return is_request, True
+    if buffer.find(b"embeddings", keyword_end, end) >= 0:
+        return is_request, False
+    return None
+
+
+def find_thread_tag(buffer, start, end):
+    """行内の [T123][filename] を探し、(スレッドID, ファイル名) のバイト列を返す（なければNone）"""
+    pos = start
+    while True:
+        tag_start = buffer.find(b"[T", pos, end)
+        if tag_start < 0:
+            return None
+        id_end = buffer.find(b"]", tag_start + 2, end)
+        if id_end < 0:
+            return None
+
+        # 形式が崩れている場合は、次の [T から探し直す
+        thread_id = buffer[tag_start + 2 : id_end]
+        if thread_id.isdigit() and buffer[id_end + 1 : id_end + 2] == b"[":
+            name_end = buffer.find(b"]", id_end + 2, end)
+            if name_end > id_end + 2:
+                return thread_id, buffer[id_end + 2 : name_end]
+        pos = tag_start + 1
+
+
+# キーワード別の行解析で使う正規表現（モジュール読み込み時に1回だけコンパイルする）
+WAIT_SECONDS_PATTERN = re.compile(r"Waiting (\d+) seconds")
+RETRY_AFTER_PATTERN = re.compile(r"(\d+)秒後にリトライ")
+ATTEMPT_PATTERN = re.compile(r"attempt (\d+)/(\d+)")
+TOTAL_FILES_PATTERN = re.compile(r"処理ファイル数: (\d+)")
+TOTAL_CHUNKS_PATTERN = re.compile(r"作成チャンク数: (\d+)")
+TOTAL_EPISODES_PATTERN = re.compile(r"登録エピソード数: (\d+)")
+FAILED_FILES_PATTERN = re.compile(r"処理失敗ファイル数: (\d+)")
+PERFORMANCE_PATTERN = re.compile(
+    r"⏱️ パフォーマンス - (.+?) \((.+?)\): 解析 ([\d.]+)秒, チャンク分割 ([\d.]+)秒, エピソード作成 ([\d.]+)秒, 合計 ([\d.]+)秒"
+)
+WORKER_ADJUST_PATTERN = re.compile(r"📊 ワーカー数調整 - (.+?): (\d+) → (\d+) ワーカー")
+FILE_STATS_PATTERN = re.compile(
+    r"📈 ファイル統計 - 総数: (\d+), 画像: (\d+), PDF: (\d+), その他: (\d+)"
+)
+PARALLEL_WORKERS_PATTERN = re.compile(r"🚀 並列処理モードで実行（ワーカー数: (\d+)）")
+LARGE_FILE_PATTERN = re.compile(r"⚠️ 大きなファイル検出: (.+?) \(([\d.]+)MB\)")
+MEDIUM_FILE_PATTERN = re.compile(r"📄 大きめのファイル: (.+?) \(([\d.]+)MB\)")
+BULK_SAVE_PATTERN = re.compile(r"📦 一括保存開始（並列）: (\d+)件のエピソード")
+FILE_EPISODES_PATTERN = re.compile(r"📁 ファイル処理開始: (.+?) \((\d+)エピソード\)")
+
+
+def parse_retry_line(retry_type, wait_pattern, line, time_obj, file_name, offset):
+    """リトライ行を解析（時刻がある場合のみ）"""
+    if time_obj is None:
+        return None
+
+    wait_match = wait_pattern.search(line)
+    attempt_match = ATTEMPT_PATTERN.search(line)
+
+    wait_time = int(wait_match.group(1)) if wait_match else 0
+    current_attempt = int(attempt_match.group(1)) if attempt_match else 0
+    max_attempts = int(attempt_match.group(2)) if attempt_match else 0
+
+    return "retry_events", {
+        "type": retry_type,
+        "time": time_obj,
+        "file_name": file_name,
+        "wait_time": wait_time,
+        "attempt": current_attempt,
+        "max_attempts": max_attempts,
+        "offset": offset,
+    }
+
+
+def parse_summary_count_line(key, pattern, line, time_obj, file_name, offset):
+    """最終処理結果の件数行を解析"""
+    count_match = pattern.search(line)
+    if count_match:
+        return "processing_summary", {key: int(count_match.group(1))}
+    return None
+
+
+def split_failed_file_message(line):
+    """失敗ファイル行から (ファイルパス, エラーメッセージ) を取り出す（形式が異なる場合はNone）"""
+    # 例: ❌ ファイル処理失敗: /data/input/SRv6-IaaS/ADR/images/tag_model.png - libGL.so.1: cannot open shared object file
+    prefix_pos = line.find(ERROR_PREFIX)
+    if prefix_pos < 0:
         return None
 
+    # ファイルパスとエラーメッセージを位置で切り出す（split で中間リストを作らない）
+    body_start = prefix_pos + len(ERROR_PREFIX)
+    body_end = line.find(ERROR_PREFIX, body_start)
+    file_and_error = line[body_start : body_end if body_end >= 0 else None].strip()
+    separator = file_and_error.find(" - ")
+    if separator < 0:
+        return None
+    return file_and_error[:separator].strip(), file_and_error[separator + 3 :].strip()
+
+
+def parse_failed_file_line(line, time_obj, file_name, offset):
+    """失敗ファイル行を収集（詳細は時刻がある場合のみ）"""
+    failed_file = split_failed_file_message(line) if time_obj is not None else None
+    detail = None
+    if failed_file:
+        detail = {
+            "file_path": failed_file[0],
+            "error_message": failed_file[1],
+            "time": time_obj,
+            "offset": offset,
+        }
+    # 行そのものは失敗ファイル詳細の表示で使うため、時刻がなくても記録する
+    return "failed_file", {"line": line.strip(), "detail": detail}
+
+
+def parse_performance_line(line, time_obj, file_name, offset):
+    """パフォーマンスモニタリング機能の分析"""
+    # 例: ⏱️ パフォーマンス - rpc_callbacks.md (md): 解析 1.38秒, チャンク分割 0.01秒, エピソード作成 0.00秒, 合計 1.39秒
+    perf_match = PERFORMANCE_PATTERN.search(line)
+    if perf_match:
+        return "performance_data", {
+            "file_name": perf_match.group(1),
+            "file_type": perf_match.group(2),
+            "parse_time": float(perf_match.group(3)),
+            "chunk_time": float(perf_match.group(4)),
+            "episode_time": float(perf_match.group(5)),
+            "total_time": float(perf_match.group(6)),
+            "time": time_obj,
+            "offset": offset,
+        }
+    return None
+
+
+def parse_worker_adjust_line(line, time_obj, file_name, offset):
+    """ワーカー数最適化の分析"""
+    # 例: 📊 ワーカー数調整 - 画像ファイル率 40.0%: 3 → 4 ワーカー
+    worker_match = WORKER_ADJUST_PATTERN.search(line)
+    if worker_match:
+        return "worker_optimization", {
+            "adjustment_reason": worker_match.group(1),
+            "original_workers": int(worker_match.group(2)),
+            "optimized_workers": int(worker_match.group(3)),
+            "time": time_obj,
+            "offset": offset,
+        }
+    return None
+
+
+def parse_file_stats_line(line, time_obj, file_name, offset):
+    """ファイル統計の分析"""
+    # 例: 📈 ファイル統計 - 総数: 5, 画像: 2, PDF: 2, その他: 1
+    stats_match = FILE_STATS_PATTERN.search(line)
+    if stats_match:
+        return "worker_optimization", {
+            "file_stats": {
+                "total": int(stats_match.group(1)),
+                "images": int(stats_match.group(2)),
+                "pdfs": int(stats_match.group(3)),
+                "others": int(stats_match.group(4)),
+            }
+        }
+    return None
+
+
+def parse_parallel_workers_line(line, time_obj, file_name, offset):
+    """最終的なワーカー数の分析"""
+    # 例: 🚀 並列処理モードで実行（ワーカー数: 3）
+    parallel_match = PARALLEL_WORKERS_PATTERN.search(line)
+    if parallel_match:
+        return "worker_optimization", {"final_workers": int(parallel_match.group(1))}
+    return None
+
+
+def parse_file_size_line(warning_type, pattern, line, time_obj, file_name, offset):
+    """メモリ効率改善（ファイルサイズ警告）の分析"""
+    size_match = pattern.search(line)
+    if size_match:
+        return "file_size_warnings", {
+            "file_name": size_match.group(1),
+            "size_mb": float(size_match.group(2)),
+            "warning_type": warning_type,
+            "time": time_obj,
+            "offset": offset,
+        }
+    return None
+
+
+def parse_bulk_save_line(line, time_obj, file_name, offset):
+    """チャンキング戦略 (エピソード作成数) の分析"""
+    # 例: 📦 一括保存開始（並列）: 661件のエピソード
+    episode_match = BULK_SAVE_PATTERN.search(line)
+    if episode_match:
+        return "chunk_analysis", {
+            "total_episodes": int(episode_match.group(1)),
+            "time": time_obj,
+            "offset": offset,
+        }
+    return None
+
+
+def parse_file_episodes_line(line, time_obj, file_name, offset):
+    """ファイルごとのエピソード数の分析"""
+    # 例: 📁 ファイル処理開始: rpc_callbacks.md (5エピソード)
+    file_episode_match = FILE_EPISODES_PATTERN.search(line)
+    if file_episode_match:
+        return "file_episodes", {
+            "file_name": file_episode_match.group(1),
+            "episode_count": int(file_episode_match.group(2)),
+        }
+    return None
+
+
+# 行が含むキーワードから解析関数を引く（elifの連鎖で順に部分文字列を調べない）
+# 解析関数はいずれも (行, 時刻, ファイル名, 行頭のバイト位置) を受け取る
+LINE_HANDLERS = {
+    keyword.encode("utf-8"): handler
+    for keyword, handler in (
+        # 例: 🔄 Rate limit detected. Waiting 61 seconds before retry (rate limit attempt 1/3)
+        (
+            "🔄 Rate limit detected",
+            partial(parse_retry_line, "rate_limit", WAIT_SECONDS_PATTERN),
+        ),
+        # 例: ⚠️ Graphitiエンティティ競合エラー。1秒後にリトライ (index error attempt 1/3)
+        (
+            "⚠️ Graphitiエンティティ競合エラー",
+            partial(parse_retry_line, "index_error", RETRY_AFTER_PATTERN),
+        ),
+        (
+            "処理ファイル数:",
+            partial(parse_summary_count_line, "total_files", TOTAL_FILES_PATTERN),
+        ),
+        (
+            "作成チャンク数:",
+            partial(parse_summary_count_line, "total_chunks", TOTAL_CHUNKS_PATTERN),
+        ),
+        (
+            "登録エピソード数:",
+            partial(parse_summary_count_line, "total_episodes", TOTAL_EPISODES_PATTERN),
+        ),
+        (
+            "⚠️ 処理失敗ファイル数:",
+            partial(parse_summary_count_line, "failed_files", FAILED_FILES_PATTERN),
+        ),
+        (ERROR_PREFIX, parse_failed_file_line),
+        ("⏱️ パフォーマンス -", parse_performance_line),
+        ("📊 ワーカー数調整", parse_worker_adjust_line),
+        ("📈 ファイル統計", parse_file_stats_line),
+        ("🚀 並列処理モードで実行（ワーカー数:", parse_parallel_workers_line),
+        # 例: ⚠️ 大きなファイル検出: Toodledo超タスク管理術.pdf (57.4MB) - メモリ使用量にご注意ください
+        (
+            "⚠️ 大きなファイル検出:",
+            partial(parse_file_size_line, "large_file", LARGE_FILE_PATTERN),
+        ),
+        # 例: 📄 大きめのファイル: document.pdf (75.2MB)
+        (
+            "📄 大きめのファイル:",
+            partial(parse_file_size_line, "medium_file", MEDIUM_FILE_PATTERN),
+        ),
+        ("📦 一括保存開始（並列）:", parse_bulk_save_line),
+        ("📁 ファイル処理開始:", parse_file_episodes_line),
+    )
+}
+
+
+def parse_line(buffer, start, end, keyword, keyword_end):
+    """キーワードを含む1行を解析し、(種別, 内容) のイベントに変換する（対象外の行はNone）"""
+    # HTTPリクエスト/レスポンス行（時刻がある場合のみ）
+    # バイト列のまま照合し、必要なグループだけをデコードする
+    http_kind = classify_http_line(buffer, keyword, keyword_end, end)
+    http_match = LINE_HEADER_PATTERN.match(buffer, start, end) if http_kind else None
+    if http_match:
+        time_obj = parse_time(http_match.group("time"))
+        if time_obj is None:
+            return None
+
+        # 同じスレッドID・ファイル名が大量の行に現れるため、intern して1つの文字列を共有する
+        thread_id = sys.intern(
+            (http_match.group("thread_id") or b"unknown").decode("ascii")
+        )
+        file_name = sys.intern(
+            (http_match.group("file_name") or b"unknown").decode(
+                "utf-8", errors="replace"
+            )
+        )
+        is_request, is_llm = http_kind
+        return "http", (is_request, is_llm, thread_id, file_name, time_obj, start)
 
-def analyze_log_file(log_file_path):
-    """ログファイルを分析してAPI呼び出し統計を生成"""
+    handler = LINE_HANDLERS.get(keyword)
+    if handler is None:
+        return None
 
-    llm_requests = []
-    embedding_requests = []
+    # 時刻を抽出
+    time_match = TIME_PATTERN.match(buffer, start, end)
+
+    # 時刻あり行の処理
+    if time_match:
+        time_obj = parse_time(time_match.group())
+        if time_obj is None:
+            return None
+
+        # スレッドIDとファイル名を抽出 [T123][filename]
+        thread_tag = find_thread_tag(buffer, time_match.end(), end)
+        file_name = (
+            sys.intern(thread_tag[1].decode("utf-8", errors="replace"))
+            if thread_tag
+            else "unknown"
+        )
+    else:
+        # 時刻なし行でも処理サマリーは解析
+        time_obj = None
+        file_name = "main"
+
+    line = buffer[start:end].decode("utf-8", errors="replace")
+    return handler(line, time_obj, file_name, start)
+
+
+def iter_log_events(buffer, start=0, end=None):
+    """バッファの指定範囲からイベントを順に取り出す"""
+    for line_start, line_end, keyword, keyword_end in iter_keyword_lines(
+        buffer, start, end
+    ):
+        event = parse_line(buffer, line_start, line_end, keyword, keyword_end)
+        if event:
+            yield event
+
+
+def scan_log_range(log_file_path, start, end):
+    """ワーカープロセスでログの指定範囲を解析し、イベント一覧を返す"""
+    with open(log_file_path, "rb") as f, open_log_buffer(f) as buffer:
+        return list(iter_log_events(buffer, start, end))
+
+
+def split_log_ranges(buffer, workers=None):
+    """ログを行境界で分割し、各範囲の (開始位置, 終了位置) を返す"""
+    size = len(buffer)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    count = max(1, min(workers, size // PARALLEL_MIN_RANGE_BYTES))
+
+    ranges = []
+    start = 0
+    for i in range(1, count + 1):
+        if start >= size:
+            break
+        newline = buffer.find(b"\n", max(start, size * i // count))
+        end = size if i == count or newline < 0 else newline + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def resolve_line_numbers(buffer, infos):
+    """記録のバイト位置（offset）から行番号（line_num）を求める
+
+    行番号を表示するのは未完了リクエストだけのため、解析中は数えずに最後にまとめて求める。
+    """
+    pos = 0
+    line_num = 1
+    for info in sorted(infos, key=lambda info: info["offset"]):
+        line_num += buffer[pos : info["offset"]].count(b"\n")
+        pos = info["offset"]
+        info["line_num"] = line_num
+
+
+def aggregate_events(events):
+    """ログ順のイベントを集計して分析結果を生成"""
+    llm_requests = RequestStats()
+    embedding_requests = RequestStats()
     retry_events = []
     processing_summary = {}
 
@@ -36,352 +566,68 @@ def analyze_log_file(log_file_path):
     file_size_warnings = []  # メモリ効率改善
     chunk_analysis = []  # チャンキング戦略
 
-    # リクエスト開始時刻を記録
-    pending_llm = {}
-    pending_embedding = {}
+    # 失敗ファイル行（print_failed_filesでログを読み直さないよう保持する）
+    failed_file_lines = []
 
-    try:
-        with open(log_file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                # 時刻を抽出
-                time_match = re.match(r"^(\d{2}:\d{2}:\d{2})", line)
-
-                # 時刻あり行の処理
-                if time_match:
-                    time_str = time_match.group(1)
-                    time_obj = parse_time(time_str)
-                    if not time_obj:
-                        continue
-
-                    # スレッドIDとファイル名を抽出 [T123][filename]
-                    thread_match = re.search(r"\[T(\d+)\]\[([^\]]+)\]", line)
-                    thread_id = thread_match.group(1) if thread_match else "unknown"
-                    file_name = thread_match.group(2) if thread_match else "unknown"
-                else:
-                    # 時刻なし行でも処理サマリーは解析
-                    time_obj = None
-                    thread_id = "main"
-                    file_name = "main"
-
-                # LLM リクエスト開始（時刻がある場合のみ）
-                if (
-                    time_obj
-                    and "Sending HTTP Request: POST" in line
-                    and "chat/completions" in line
-                ):
-                    key = f"{thread_id}_{file_name}"
-                    pending_llm[key] = {
-                        "start_time": time_obj,
-                        "line_num": line_num,
-                        "thread_id": thread_id,
-                        "file_name": file_name,
-                    }
+    # 一覧に追加するだけのイベントの格納先
+    event_lists = {
+        "retry_events": retry_events,
+        "performance_data": performance_data,
+        "file_size_warnings": file_size_warnings,
+        "chunk_analysis": chunk_analysis,
+    }
+
+    # リクエスト開始時刻を記録
+    # (スレッドID, ファイル名) ごとに到着順のキューで保持し、レスポンスは最古の開始と対応付ける
+    pending_llm = defaultdict(deque)
+    pending_embedding = defaultdict(deque)
+
+    for kind, value in events:
+        if kind == "http":
+            is_request, is_llm, thread_id, file_name, time_obj, offset = value
+            if is_llm:
+                pending, requests = pending_llm, llm_requests
+            else:
+                pending, requests = pending_embedding, embedding_requests
+            key = (thread_id, file_name)
 
-                # LLM レスポンス（時刻がある場合のみ）
-                elif (
-                    time_obj
-                    and "HTTP Response: POST" in line
-                    and "chat/completions" in line
-                ):
-                    key = f"{thread_id}_{file_name}"
-                    if key in pending_llm:
-                        start_info = pending_llm.pop(key)
-                        duration = (time_obj - start_info["start_time"]).total_seconds()
-                        llm_requests.append(
-                            {
-                                "thread_id": thread_id,
-                                "file_name": file_name,
-                                "start_time": start_info["start_time"],
-                                "end_time": time_obj,
-                                "duration": duration,
-                                "start_line": start_info["line_num"],
-                                "end_line": line_num,
-                            }
-                        )
-
-                # Embedding リクエスト開始（時刻がある場合のみ）
-                elif (
-                    time_obj
-                    and "Sending HTTP Request: POST" in line
-                    and "embeddings" in line
-                ):
-                    key = f"{thread_id}_{file_name}_{time_obj.timestamp()}"  # 同時並行のため時刻も含める
-                    pending_embedding[key] = {
+            # リクエスト開始
+            if is_request:
+                pending[key].append(
+                    {
                         "start_time": time_obj,
-                        "line_num": line_num,
+                        "offset": offset,
                         "thread_id": thread_id,
                         "file_name": file_name,
                     }
+                )
 
-                # Embedding レスポンス（時刻がある場合のみ）
-                elif (
-                    time_obj and "HTTP Response: POST" in line and "embeddings" in line
-                ):
-                    # 最も近い開始時刻のリクエストとマッチング
-                    matching_key = None
-                    min_diff = float("inf")
-
-                    for key, start_info in pending_embedding.items():
-                        if (
-                            start_info["thread_id"] == thread_id
-                            and start_info["file_name"] == file_name
-                        ):
-                            diff = abs(
-                                (time_obj - start_info["start_time"]).total_seconds()
-                            )
-                            if diff < min_diff:
-                                min_diff = diff
-                                matching_key = key
-
-                    if matching_key:
-                        start_info = pending_embedding.pop(matching_key)
-                        duration = (time_obj - start_info["start_time"]).total_seconds()
-                        embedding_requests.append(
-                            {
-                                "thread_id": thread_id,
-                                "file_name": file_name,
-                                "start_time": start_info["start_time"],
-                                "end_time": time_obj,
-                                "duration": duration,
-                                "start_line": start_info["line_num"],
-                                "end_line": line_num,
-                            }
-                        )
-
-                # Rate limitリトライの検出（時刻がある場合のみ）
-                elif time_obj and "🔄 Rate limit detected" in line:
-                    # 例: 🔄 Rate limit detected. Waiting 61 seconds before retry (rate limit attempt 1/3)
-                    wait_match = re.search(r"Waiting (\d+) seconds", line)
-                    attempt_match = re.search(r"attempt (\d+)/(\d+)", line)
-
-                    wait_time = int(wait_match.group(1)) if wait_match else 0
-                    current_attempt = (
-                        int(attempt_match.group(1)) if attempt_match else 0
-                    )
-                    max_attempts = int(attempt_match.group(2)) if attempt_match else 0
-
-                    retry_events.append(
-                        {
-                            "type": "rate_limit",
-                            "time": time_obj,
-                            "file_name": file_name,
-                            "wait_time": wait_time,
-                            "attempt": current_attempt,
-                            "max_attempts": max_attempts,
-                            "line_num": line_num,
-                        }
-                    )
-
-                # IndexErrorリトライの検出（時刻がある場合のみ）
-                elif time_obj and "⚠️ Graphitiエンティティ競合エラー" in line:
-                    # 例: ⚠️ Graphitiエンティティ競合エラー。1秒後にリトライ (index error attempt 1/3)
-                    wait_match = re.search(r"(\d+)秒後にリトライ", line)
-                    attempt_match = re.search(r"attempt (\d+)/(\d+)", line)
-
-                    wait_time = int(wait_match.group(1)) if wait_match else 0
-                    current_attempt = (
-                        int(attempt_match.group(1)) if attempt_match else 0
-                    )
-                    max_attempts = int(attempt_match.group(2)) if attempt_match else 0
-
-                    retry_events.append(
-                        {
-                            "type": "index_error",
-                            "time": time_obj,
-                            "file_name": file_name,
-                            "wait_time": wait_time,
-                            "attempt": current_attempt,
-                            "max_attempts": max_attempts,
-                            "line_num": line_num,
-                        }
-                    )
-
-                # 最終処理結果の検出
-                elif "ドキュメント登録が正常に登録されました" in line:
-                    # 後続の処理結果行を探す
-                    pass
-                elif "処理ファイル数:" in line:
-                    file_count_match = re.search(r"処理ファイル数: (\d+)", line)
-                    if file_count_match:
-                        processing_summary["total_files"] = int(
-                            file_count_match.group(1)
-                        )
-                elif "作成チャンク数:" in line:
-                    chunk_count_match = re.search(r"作成チャンク数: (\d+)", line)
-                    if chunk_count_match:
-                        processing_summary["total_chunks"] = int(
-                            chunk_count_match.group(1)
-                        )
-                elif "登録エピソード数:" in line:
-                    episode_count_match = re.search(r"登録エピソード数: (\d+)", line)
-                    if episode_count_match:
-                        processing_summary["total_episodes"] = int(
-                            episode_count_match.group(1)
-                        )
-                elif "⚠️ 処理失敗ファイル数:" in line:
-                    failed_count_match = re.search(r"処理失敗ファイル数: (\d+)", line)
-                    if failed_count_match:
-                        processing_summary["failed_files"] = int(
-                            failed_count_match.group(1)
-                        )
-
-                # 失敗ファイルの詳細を収集（時刻がある場合のみ）
-                elif time_obj and "❌ ファイル処理失敗:" in line:
-                    # 例: ❌ ファイル処理失敗: /data/input/SRv6-IaaS/ADR/images/tag_model.png - libGL.so.1: cannot open shared object file
-                    file_match = re.search(r"❌ ファイル処理失敗: ([^-]+) - (.+)", line)
-                    if file_match:
-                        file_path = file_match.group(1).strip()
-                        error_message = file_match.group(2).strip()
-
-                        if "failed_file_details" not in processing_summary:
-                            processing_summary["failed_file_details"] = []
-
-                        processing_summary["failed_file_details"].append(
-                            {
-                                "file_path": file_path,
-                                "error_message": error_message,
-                                "time": time_obj,
-                                "line_num": line_num,
-                            }
-                        )
-
-                # === ingest改善機能の分析 ===
-
-                # 1. パフォーマンスモニタリング機能
-                elif "⏱️ パフォーマンス -" in line:
-                    # 例: ⏱️ パフォーマンス - rpc_callbacks.md (md): 解析 1.38秒, チャンク分割 0.01秒, エピソード作成 0.00秒, 合計 1.39秒
-                    perf_match = re.search(
-                        r"⏱️ パフォーマンス - (.+?) \((.+?)\): 解析 ([\d.]+)秒, チャンク分割 ([\d.]+)秒, エピソード作成 ([\d.]+)秒, 合計 ([\d.]+)秒",
-                        line,
-                    )
-                    if perf_match:
-                        performance_data.append(
-                            {
-                                "file_name": perf_match.group(1),
-                                "file_type": perf_match.group(2),
-                                "parse_time": float(perf_match.group(3)),
-                                "chunk_time": float(perf_match.group(4)),
-                                "episode_time": float(perf_match.group(5)),
-                                "total_time": float(perf_match.group(6)),
-                                "time": time_obj,
-                                "line_num": line_num,
-                            }
-                        )
-
-                # 2. ワーカー数最適化
-                elif "📊 ワーカー数調整" in line:
-                    # 例: 📊 ワーカー数調整 - 画像ファイル率 40.0%: 3 → 4 ワーカー
-                    worker_match = re.search(
-                        r"📊 ワーカー数調整 - (.+?): (\d+) → (\d+) ワーカー", line
-                    )
-                    if worker_match:
-                        worker_optimization["adjustment_reason"] = worker_match.group(1)
-                        worker_optimization["original_workers"] = int(
-                            worker_match.group(2)
-                        )
-                        worker_optimization["optimized_workers"] = int(
-                            worker_match.group(3)
-                        )
-                        worker_optimization["time"] = time_obj
-                        worker_optimization["line_num"] = line_num
-
-                elif "📈 ファイル統計" in line:
-                    # 例: 📈 ファイル統計 - 総数: 5, 画像: 2, PDF: 2, その他: 1
-                    stats_match = re.search(
-                        r"📈 ファイル統計 - 総数: (\d+), 画像: (\d+), PDF: (\d+), その他: (\d+)",
-                        line,
-                    )
-                    if stats_match:
-                        worker_optimization["file_stats"] = {
-                            "total": int(stats_match.group(1)),
-                            "images": int(stats_match.group(2)),
-                            "pdfs": int(stats_match.group(3)),
-                            "others": int(stats_match.group(4)),
-                        }
-
-                elif "🚀 並列処理モードで実行（ワーカー数:" in line:
-                    # 例: 🚀 並列処理モードで実行（ワーカー数: 3）
-                    parallel_match = re.search(
-                        r"🚀 並列処理モードで実行（ワーカー数: (\d+)）", line
-                    )
-                    if parallel_match:
-                        worker_optimization["final_workers"] = int(
-                            parallel_match.group(1)
-                        )
-
-                # 3. メモリ効率改善
-                elif "⚠️ 大きなファイル検出:" in line:
-                    # 例: ⚠️ 大きなファイル検出: Toodledo超タスク管理術.pdf (57.4MB) - メモリ使用量にご注意ください
-                    size_match = re.search(
-                        r"⚠️ 大きなファイル検出: (.+?) \(([\d.]+)MB\)", line
-                    )
-                    if size_match:
-                        file_size_warnings.append(
-                            {
-                                "file_name": size_match.group(1),
-                                "size_mb": float(size_match.group(2)),
-                                "warning_type": "large_file",
-                                "time": time_obj,
-                                "line_num": line_num,
-                            }
-                        )
-
-                elif "📄 大きめのファイル:" in line:
-                    # 例: 📄 大きめのファイル: document.pdf (75.2MB)
-                    size_match = re.search(
-                        r"📄 大きめのファイル: (.+?) \(([\d.]+)MB\)", line
-                    )
-                    if size_match:
-                        file_size_warnings.append(
-                            {
-                                "file_name": size_match.group(1),
-                                "size_mb": float(size_match.group(2)),
-                                "warning_type": "medium_file",
-                                "time": time_obj,
-                                "line_num": line_num,
-                            }
-                        )
-
-                # 4. チャンキング戦略 (エピソード作成数の情報も収集)
-                elif "📦 一括保存開始（並列）:" in line:
-                    # 例: 📦 一括保存開始（並列）: 661件のエピソード
-                    episode_match = re.search(
-                        r"📦 一括保存開始（並列）: (\d+)件のエピソード", line
-                    )
-                    if episode_match:
-                        chunk_analysis.append(
-                            {
-                                "total_episodes": int(episode_match.group(1)),
-                                "time": time_obj,
-                                "line_num": line_num,
-                            }
-                        )
-
-                elif "📁 ファイル処理開始:" in line:
-                    # 例: 📁 ファイル処理開始: rpc_callbacks.md (5エピソード)
-                    file_episode_match = re.search(
-                        r"📁 ファイル処理開始: (.+?) \((\d+)エピソード\)", line
+            # レスポンス
+            else:
+                queue = pending.get(key)
+                if queue:
+                    start_info = queue.popleft()
+                    requests.add(
+                        file_name, elapsed_seconds(start_info["start_time"], time_obj)
                     )
-                    if file_episode_match:
-                        # chunk_analysisに個別ファイルのエピソード数を追加
-                        if not chunk_analysis:
-                            chunk_analysis.append({"file_episodes": []})
-                        elif "file_episodes" not in chunk_analysis[-1]:
-                            chunk_analysis[-1]["file_episodes"] = []
-
-                        chunk_analysis[-1]["file_episodes"].append(
-                            {
-                                "file_name": file_episode_match.group(1),
-                                "episode_count": int(file_episode_match.group(2)),
-                            }
-                        )
 
-    except FileNotFoundError:
-        print(f"エラー: ファイルが見つかりません: {log_file_path}")
-        return None
-    except Exception as e:
-        print(f"エラー: ログファイル解析中にエラーが発生: {e}")
-        return None
+        elif kind == "processing_summary":
+            processing_summary.update(value)
+        elif kind == "failed_file":
+            failed_file_lines.append(value["line"])
+            if value["detail"]:
+                processing_summary.setdefault("failed_file_details", []).append(
+                    value["detail"]
+                )
+        elif kind == "worker_optimization":
+            worker_optimization.update(value)
+        elif kind == "file_episodes":
+            # chunk_analysisに個別ファイルのエピソード数を追加
+            if not chunk_analysis:
+                chunk_analysis.append({"file_episodes": []})
+            chunk_analysis[-1].setdefault("file_episodes", []).append(value)
+        else:
+            event_lists[kind].append(value)
 
     return {
         "llm_requests": llm_requests,
@@ -395,6 +641,68 @@ def analyze_log_file(log_file_path):
         "worker_optimization": worker_optimization,
         "file_size_warnings": file_size_warnings,
         "chunk_analysis": chunk_analysis,
+        "failed_file_lines": failed_file_lines,
+    }
+
+
+def analyze_log_file(log_file_path, workers=None):
+    """ログファイルを分析してAPI呼び出し統計を生成
+
+    大きなログは行境界で分割して複数プロセスで解析し、
+    リクエストとレスポンスの対応付けなど順序に依存する集計は親プロセスでログ順に行う。
+    """
+    try:
+        with open(log_file_path, "rb") as f, open_log_buffer(f) as buffer:
+            ranges = split_log_ranges(buffer, workers)
+            if len(ranges) <= 1:
+                result = aggregate_events(iter_log_events(buffer))
+            else:
+                starts, ends = zip(*ranges)
+                with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                    results = executor.map(
+                        scan_log_range, repeat(log_file_path), starts, ends
+                    )
+                    result = aggregate_events(chain.from_iterable(results))
+
+            resolve_line_numbers(
+                buffer,
+                [
+                    info
+                    for pending in (result["pending_llm"], result["pending_embedding"])
+                    for queue in pending.values()
+                    for info in queue
+                ],
+            )
+            return result
+
+    except FileNotFoundError:
+        print(f"エラー: ファイルが見つかりません: {log_file_path}")
+        return None
+    except Exception as e:
+        print(f"エラー: ログファイル解析中にエラーが発生: {e}")
+        return None
+
+
+def flatten_pending(pending):
+    """キューごとの未完了リクエストを行番号順の一覧にする"""
+    return sorted(
+        (info for queue in pending.values() for info in queue),
+        key=lambda info: info["offset"],
+    )
+
+
+def summarize_durations(requests):
+    """集計済みの所要時間を全体（件数・合計・平均・最大・最小）とファイル別（件数・合計）に整形"""
+    return {
+        "count": requests.count,
+        "total": requests.total,
+        "avg": requests.total / requests.count,
+        "max": requests.max_duration,
+        "min": requests.min_duration,
+        "per_file": [
+            (file_name, count, total)
+            for file_name, (count, total) in requests.per_file.items()
+        ],
     }
 
 
@@ -405,6 +713,10 @@ def print_statistics(analysis_result):
 
     llm_requests = analysis_result["llm_requests"]
     embedding_requests = analysis_result["embedding_requests"]
+    llm_summary = summarize_durations(llm_requests) if llm_requests else None
+    embedding_summary = (
+        summarize_durations(embedding_requests) if embedding_requests else None
+    )
 
     print("=" * 80)
     print("API呼び出し分析結果")
@@ -414,63 +726,39 @@ def print_statistics(analysis_result):
     print("\n🤖 LLM API呼び出し (chat/completions)")
     print(f"  総呼び出し回数: {len(llm_requests)}")
 
-    if llm_requests:
-        durations = [req["duration"] for req in llm_requests]
-        avg_duration = sum(durations) / len(durations)
-        max_duration = max(durations)
-        min_duration = min(durations)
-        total_duration = sum(durations)
-
-        print(f"  平均処理時間: {avg_duration:.2f}秒")
-        print(f"  最大処理時間: {max_duration:.2f}秒")
-        print(f"  最小処理時間: {min_duration:.2f}秒")
-        print(f"  総処理時間: {total_duration:.2f}秒")
+    if llm_summary:
+        print(f"  平均処理時間: {llm_summary['avg']:.2f}秒")
+        print(f"  最大処理時間: {llm_summary['max']:.2f}秒")
+        print(f"  最小処理時間: {llm_summary['min']:.2f}秒")
+        print(f"  総処理時間: {llm_summary['total']:.2f}秒")
 
         # ファイル別統計
-        file_stats = defaultdict(list)
-        for req in llm_requests:
-            file_stats[req["file_name"]].append(req["duration"])
-
         print("\n  📁 ファイル別LLM呼び出し:")
-        for file_name, durations in file_stats.items():
-            count = len(durations)
-            avg = sum(durations) / len(durations)
-            total = sum(durations)
+        for file_name, count, total in llm_summary["per_file"]:
+            avg = total / count
             print(f"    {file_name}: {count}回, 平均{avg:.2f}秒, 合計{total:.2f}秒")
 
     # Embedding統計
     print("\n🔤 Embedding API呼び出し (/embeddings)")
     print(f"  総呼び出し回数: {len(embedding_requests)}")
 
-    if embedding_requests:
-        durations = [req["duration"] for req in embedding_requests]
-        avg_duration = sum(durations) / len(durations)
-        max_duration = max(durations)
-        min_duration = min(durations)
-        total_duration = sum(durations)
-
-        print(f"  平均処理時間: {avg_duration:.2f}秒")
-        print(f"  最大処理時間: {max_duration:.2f}秒")
-        print(f"  最小処理時間: {min_duration:.2f}秒")
-        print(f"  総処理時間: {total_duration:.2f}秒")
+    if embedding_summary:
+        print(f"  平均処理時間: {embedding_summary['avg']:.2f}秒")
+        print(f"  最大処理時間: {embedding_summary['max']:.2f}秒")
+        print(f"  最小処理時間: {embedding_summary['min']:.2f}秒")
+        print(f"  総処理時間: {embedding_summary['total']:.2f}秒")
 
         # ファイル別統計
-        file_stats = defaultdict(list)
-        for req in embedding_requests:
-            file_stats[req["file_name"]].append(req["duration"])
-
         print("\n  📁 ファイル別Embedding呼び出し:")
-        for file_name, durations in file_stats.items():
-            count = len(durations)
-            avg = sum(durations) / len(durations)
-            total = sum(durations)
+        for file_name, count, total in embedding_summary["per_file"]:
+            avg = total / count
             print(f"    {file_name}: {count}回, 平均{avg:.2f}秒, 合計{total:.2f}秒")
 
     # 比較分析
     print("\n📊 比較分析")
-    if llm_requests and embedding_requests:
-        llm_total = sum(req["duration"] for req in llm_requests)
-        embedding_total = sum(req["duration"] for req in embedding_requests)
+    if llm_summary and embedding_summary:
+        llm_total = llm_summary["total"]
+        embedding_total = embedding_summary["total"]
         grand_total = llm_total + embedding_total
 
         llm_percentage = (llm_total / grand_total) * 100
@@ -483,17 +771,17 @@ def print_statistics(analysis_result):
         print(f"  API呼び出し総時間: {grand_total:.2f}秒")
 
     # 未完了リクエスト警告
-    pending_llm = analysis_result["pending_llm"]
-    pending_embedding = analysis_result["pending_embedding"]
+    pending_llm = flatten_pending(analysis_result["pending_llm"])
+    pending_embedding = flatten_pending(analysis_result["pending_embedding"])
 
     if pending_llm:
         print(f"\n⚠️  未完了LLMリクエスト: {len(pending_llm)}件")
-        for key, info in pending_llm.items():
+        for info in pending_llm:
             print(f"    {info['file_name']} (line {info['line_num']})")
 
     if pending_embedding:
         print(f"\n⚠️  未完了Embeddingリクエスト: {len(pending_embedding)}件")
-        for key, info in pending_embedding.items():
+        for info in pending_embedding:
             print(f"    {info['file_name']} (line {info['line_num']})")
 
     # リトライ分析
@@ -506,74 +794,73 @@ def print_statistics(analysis_result):
         if rate_limit_retries:
             print(f"  📊 Rate Limitリトライ: {len(rate_limit_retries)}回")
 
-            wait_times = [r["wait_time"] for r in rate_limit_retries]
-            if wait_times:
-                avg_wait = sum(wait_times) / len(wait_times)
-                total_wait = sum(wait_times)
-                max_wait = max(wait_times)
-                min_wait = min(wait_times)
-
-                print(f"    平均待機時間: {avg_wait:.1f}秒")
-                print(f"    最大待機時間: {max_wait}秒")
-                print(f"    最小待機時間: {min_wait}秒")
-                print(f"    総待機時間: {total_wait}秒")
-
-                # ファイル別リトライ統計
-                file_retries = defaultdict(list)
-                for retry in rate_limit_retries:
-                    file_retries[retry["file_name"]].append(retry["wait_time"])
-
-                print("\n    📁 ファイル別Rate Limitリトライ:")
-                for file_name, wait_times in file_retries.items():
-                    count = len(wait_times)
-                    avg = sum(wait_times) / len(wait_times)
-                    total = sum(wait_times)
-                    print(
-                        f"      {file_name}: {count}回, 平均{avg:.1f}秒, 合計{total}秒"
-                    )
+            # 待機時間の合計・最大・最小とファイル別の [件数, 合計待機時間] を1パスで集計する
+            total_wait = 0
+            max_wait = min_wait = rate_limit_retries[0]["wait_time"]
+            file_retries = defaultdict(lambda: [0, 0])
+            for retry in rate_limit_retries:
+                wait_time = retry["wait_time"]
+                total_wait += wait_time
+                max_wait = max(max_wait, wait_time)
+                min_wait = min(min_wait, wait_time)
+                stats = file_retries[retry["file_name"]]
+                stats[0] += 1
+                stats[1] += wait_time
+            avg_wait = total_wait / len(rate_limit_retries)
+
+            print(f"    平均待機時間: {avg_wait:.1f}秒")
+            print(f"    最大待機時間: {max_wait}秒")
+            print(f"    最小待機時間: {min_wait}秒")
+            print(f"    総待機時間: {total_wait}秒")
+
+            print("\n    📁 ファイル別Rate Limitリトライ:")
+            for file_name, (count, total) in file_retries.items():
+                avg = total / count
+                print(f"      {file_name}: {count}回, 平均{avg:.1f}秒, 合計{total}秒")
 
         # IndexErrorリトライ
         index_error_retries = [r for r in retry_events if r["type"] == "index_error"]
         if index_error_retries:
             print(f"\n  ⚠️ IndexErrorリトライ: {len(index_error_retries)}回")
 
-            wait_times = [r["wait_time"] for r in index_error_retries]
-            if wait_times:
-                total_wait = sum(wait_times)
-                print(f"    総待機時間: {total_wait}秒")
-
-                # ファイル別統計
-                file_retries = defaultdict(int)
-                for retry in index_error_retries:
-                    file_retries[retry["file_name"]] += 1
+            # 総待機時間とファイル別件数を1パスで集計する
+            total_wait = 0
+            file_retries = defaultdict(int)
+            for retry in index_error_retries:
+                total_wait += retry["wait_time"]
+                file_retries[retry["file_name"]] += 1
 
-                print("    📁 ファイル別IndexErrorリトライ:")
-                for file_name, count in file_retries.items():
-                    print(f"      {file_name}: {count}回")
+            print(f"    総待機時間: {total_wait}秒")
+            print("    📁 ファイル別IndexErrorリトライ:")
+            for file_name, count in file_retries.items():
+                print(f"      {file_name}: {count}回")
 
     # 処理サマリー
     processing_summary = analysis_result.get("processing_summary", {})
     if processing_summary:
         print("\n📋 処理サマリー")
 
-        if "total_files" in processing_summary:
-            print(f"  📁 処理ファイル数: {processing_summary['total_files']}件")
+        total_files = processing_summary.get("total_files")
+        if total_files is not None:
+            print(f"  📁 処理ファイル数: {total_files}件")
 
-        if "total_chunks" in processing_summary:
-            print(f"  🔀 作成チャンク数: {processing_summary['total_chunks']}件")
+        total_chunks = processing_summary.get("total_chunks")
+        if total_chunks is not None:
+            print(f"  🔀 作成チャンク数: {total_chunks}件")
 
-        if "total_episodes" in processing_summary:
-            print(f"  📝 登録エピソード数: {processing_summary['total_episodes']}件")
+        total_episodes = processing_summary.get("total_episodes")
+        if total_episodes is not None:
+            print(f"  📝 登録エピソード数: {total_episodes}件")
 
-        if "failed_files" in processing_summary:
-            print(f"  ❌ 処理失敗ファイル数: {processing_summary['failed_files']}件")
+        failed = processing_summary.get("failed_files")
+        if failed is not None:
+            print(f"  ❌ 処理失敗ファイル数: {failed}件")
 
             # 失敗ファイルの詳細表示
-            if "failed_file_details" in processing_summary:
+            failed_file_details = processing_summary.get("failed_file_details")
+            if failed_file_details is not None:
                 print("\n    📄 失敗ファイル詳細:")
-                for i, failure in enumerate(
-                    processing_summary["failed_file_details"], 1
-                ):
+                for i, failure in enumerate(failed_file_details, 1):
                     file_name = failure["file_path"].split("/")[
                         -1
                     ]  # ファイル名のみ抽出
@@ -582,19 +869,18 @@ def print_statistics(analysis_result):
                     print(f"         エラー: {failure['error_message']}")
 
             # 成功率計算
-            if "total_files" in processing_summary:
-                total = processing_summary["total_files"]
-                failed = processing_summary["failed_files"]
+            if total_files is not None:
+                total = total_files
                 success_rate = ((total - failed) / total) * 100 if total > 0 else 0
                 print(f"  ✅ 成功率: {success_rate:.1f}% ({total - failed}/{total})")
 
     # 総合分析
-    if llm_requests and embedding_requests and retry_events:
+    if llm_summary and embedding_summary and retry_events:
         print("\n🎯 総合分析")
 
         # API処理時間
-        llm_total = sum(req["duration"] for req in llm_requests)
-        embedding_total = sum(req["duration"] for req in embedding_requests)
+        llm_total = llm_summary["total"]
+        embedding_total = embedding_summary["total"]
         api_total = llm_total + embedding_total
 
         # リトライ待機時間
@@ -684,8 +970,8 @@ def print_ingest_improvements_analysis(analysis_result):
     if worker_optimization:
         print("\n⚡ 2. 並列処理最適化 ✅")
 
-        if "file_stats" in worker_optimization:
-            stats = worker_optimization["file_stats"]
+        stats = worker_optimization.get("file_stats")
+        if stats is not None:
             print(
                 f"  ファイル統計: 総数{stats['total']}, 画像{stats['images']}, PDF{stats['pdfs']}, その他{stats['others']}"
             )
@@ -696,22 +982,19 @@ def print_ingest_improvements_analysis(analysis_result):
                 pdf_ratio = stats["pdfs"] / stats["total"] * 100
                 print(f"  ファイル比率: 画像{image_ratio:.1f}%, PDF{pdf_ratio:.1f}%")
 
-        if "adjustment_reason" in worker_optimization:
-            print(f"  ワーカー数調整: {worker_optimization['adjustment_reason']}")
-            print(
-                f"  {worker_optimization['original_workers']} → {worker_optimization['optimized_workers']} ワーカー"
-            )
+        original = worker_optimization.get("original_workers")
+        optimized = worker_optimization.get("optimized_workers")
+        adjustment_reason = worker_optimization.get("adjustment_reason")
+        if adjustment_reason is not None:
+            print(f"  ワーカー数調整: {adjustment_reason}")
+            print(f"  {original} → {optimized} ワーカー")
 
-        if "final_workers" in worker_optimization:
-            print(f"  最終ワーカー数: {worker_optimization['final_workers']}")
+        final_workers = worker_optimization.get("final_workers")
+        if final_workers is not None:
+            print(f"  最終ワーカー数: {final_workers}")
 
         # 最適化効果の評価
-        if (
-            "original_workers" in worker_optimization
-            and "optimized_workers" in worker_optimization
-        ):
-            original = worker_optimization["original_workers"]
-            optimized = worker_optimization["optimized_workers"]
+        if original is not None and optimized is not None:
             if optimized != original:
                 print(
                     f"  🎯 最適化効果: ファイル特性に応じて{abs(optimized - original)}ワーカー{'増加' if optimized > original else '削減'}"
@@ -754,12 +1037,13 @@ def print_ingest_improvements_analysis(analysis_result):
         print("\n🔀 4. チャンキング戦略改善 ✅")
 
         for analysis in chunk_analysis:
-            if "total_episodes" in analysis:
-                print(f"  総エピソード数: {analysis['total_episodes']}件")
+            total_episodes = analysis.get("total_episodes")
+            if total_episodes is not None:
+                print(f"  総エピソード数: {total_episodes}件")
 
-            if "file_episodes" in analysis:
+            file_episodes = analysis.get("file_episodes")
+            if file_episodes is not None:
                 print("  ファイル別エピソード数:")
-                file_episodes = analysis["file_episodes"]
                 total_files = len(file_episodes)
                 total_episodes = sum(fe["episode_count"] for fe in file_episodes)
 
@@ -784,35 +1068,26 @@ def print_ingest_improvements_analysis(analysis_result):
                     )
 
 
-def print_failed_files(log_file_path):
+def print_failed_files(analysis_result):
     """失敗ファイルの詳細を表示"""
-    try:
-        failed_files = []
-        with open(log_file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if ERROR_PREFIX in line:
-                    failed_files.append(line.strip())
-
-        if failed_files:
-            print(f"\n📄 失敗ファイル詳細: {len(failed_files)}件")
-            for i, line in enumerate(failed_files, 1):
-                # ログ行から情報を抽出
-                # 例: 02:42:28 [T184][tag_model] - src.usecase.register_document_usecase - ERROR - ❌ ファイル処理失敗: /data/input/.../file.png - error message
-                if ERROR_PREFIX in line:
-                    # ファイルパスとエラーメッセージを抽出
-                    parts = line.split(ERROR_PREFIX)
-                    if len(parts) > 1:
-                        file_and_error = parts[1].strip()
-                        if " - " in file_and_error:
-                            file_path, error_msg = file_and_error.split(" - ", 1)
-                            file_name = file_path.strip().split("/")[
-                                -1
-                            ]  # ファイル名のみ
-                            print(f"  {i}. {file_name}")
-                            print(f"     パス: {file_path.strip()}")
-                            print(f"     エラー: {error_msg.strip()}")
-    except Exception as e:
-        print(f"失敗ファイル詳細の取得中にエラー: {e}")
+    if not analysis_result:
+        return
+
+    failed_files = analysis_result["failed_file_lines"]
+    if failed_files:
+        print(f"\n📄 失敗ファイル詳細: {len(failed_files)}件")
+        for i, line in enumerate(failed_files, 1):
+            # ログ行から情報を抽出
+            # 例: 02:42:28 [T184][tag_model] - src.usecase.register_document_usecase - ERROR - ❌ ファイル処理失敗: /data/input/.../file.png - error message
+            failed_file = split_failed_file_message(line)
+            if not failed_file:
+                continue
+
+            file_path, error_msg = failed_file
+            file_name = file_path[file_path.rfind("/") + 1 :]  # ファイル名のみ
+            print(f"  {i}. {file_name}")
+            print(f"     パス: {file_path}")
+            print(f"     エラー: {error_msg}")
 
 
 def main():
@@ -827,13 +1102,21 @@ def main():
     print(f"📊 ログファイル分析中: {log_file_path}")
 
     analysis_result = analyze_log_file(log_file_path)
-    print_statistics(analysis_result)
 
-    # ingest改善機能の分析結果を表示
-    print_ingest_improvements_analysis(analysis_result)
+    # レポートは数百行になるため、1行ずつ書き出さずにまとめて出力する
+    # （途中で例外が発生しても、それまでの出力は書き出す）
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            print_statistics(analysis_result)
+
+            # ingest改善機能の分析結果を表示
+            print_ingest_improvements_analysis(analysis_result)
 
-    # 失敗ファイルの詳細を表示
-    print_failed_files(log_file_path)
+            # 失敗ファイルの詳細を表示
+            print_failed_files(analysis_result)
+    finally:
+        sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
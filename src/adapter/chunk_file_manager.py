@@ -1,13 +1,116 @@
 """ChunkFileManager - チャンクファイルの管理"""
 
+import errno
 import json
 import logging
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from src.adapter.parallel_read import MAX_READ_WORKERS, PARALLEL_READ_MIN_FILES
 from src.domain.chunk import Chunk
 
+try:
+    import orjson
+except ImportError:  # orjsonが未インストールの場合は標準のjsonを使う
+    orjson = None
+
+# 標準のjsonを使う場合のエンコーダ（呼び出しごとに生成しないよう1度だけ作成）
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_COMPACT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# 全チャンクを連結して保存するデータファイル名
+CHUNKS_DATA_FILE_NAME = "chunks.bin"
+
+# チャンクデータファイルの圧縮形式（メタデータの "compression" に記録）
+CHUNKS_DATA_COMPRESSION = "zlib"
+
+
+@lru_cache(maxsize=1024)
+def _extract_relative_path(file_path: str) -> str:
+    """
+    元ファイルパスから /input/ または /input_work/ 以降の相対パスを抽出する
+
+    同じファイルに対して繰り返し呼ばれるため、結果をキャッシュする。
+
+    Args:
+        file_path: 元ファイルパス
+
+    Returns:
+        str: 相対パス（プレフィックスを含まない場合は元のパス）
+    """
+    relative_path = file_path
+    for prefix in ["/input/", "/input_work/"]:
+        if prefix in file_path:
+            # 最後に出現するプレフィックスの後ろ部分を取得
+            parts = file_path.split(prefix)
+            if len(parts) >= 2:
+                relative_path = prefix.join(parts[-1:])
+            break
+    return relative_path
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    書き込み前にファイル領域をまとめて確保する
+
+    書き込みのたびに領域を拡張する代わりに、エクステント割り当てを1回で済ませる。
+    posix_fallocateが使えない環境・ファイルシステムでは何もしない。
+
+    Args:
+        fd: 書き込み先のファイルディスクリプタ
+        size: 確保するバイト数
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        # ファイルシステムが未対応の場合は通常の書き込みに任せる
+        pass
+
+
+def _dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    データをJSON（UTF-8バイト列）にシリアライズする
+
+    Args:
+        data: シリアライズするデータ
+        indent: Trueの場合はインデント付き、Falseの場合は空白なしで出力する
+
+    Returns:
+        bytes: UTF-8エンコード済みのJSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    encoder = _JSON_ENCODER if indent else _COMPACT_JSON_ENCODER
+    return encoder.encode(data).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    """
+    JSON（UTF-8バイト列）をデシリアライズする
+
+    Args:
+        raw: UTF-8エンコード済みのJSON
+
+    Returns:
+        Any: デシリアライズしたデータ
+
+    Raises:
+        json.JSONDecodeError: JSON解析に失敗した場合
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ChunkFileManager:
     """チャンクファイルの保存・読み込み・削除を管理するクラス"""
@@ -35,18 +138,8 @@ class ChunkFileManager:
         Returns:
             Path: チャンクディレクトリのパス
         """
-        # /input/ または /input_work/ から始まる相対パスを抽出
-        relative_path = file_path
-        for prefix in ["/input/", "/input_work/"]:
-            if prefix in file_path:
-                # 最後に出現するプレフィックスの後ろ部分を取得
-                parts = file_path.split(prefix)
-                if len(parts) >= 2:
-                    relative_path = prefix.join(parts[-1:])
-                break
-
         # data/input_chunks/相対パス/
-        return self._chunks_directory / relative_path
+        return self._chunks_directory / _extract_relative_path(file_path)
 
     def _get_metadata_file_path(self, file_path: str) -> Path:
         """
@@ -61,9 +154,22 @@ class ChunkFileManager:
         chunk_dir = self._get_chunk_directory(file_path)
         return chunk_dir / "metadata.json"
 
+    def _get_chunks_data_file_path(self, file_path: str) -> Path:
+        """
+        全チャンクを連結したデータファイルのパスを取得する
+
+        Args:
+            file_path: 元ファイルパス
+
+        Returns:
+            Path: チャンクデータファイルのパス
+        """
+        chunk_dir = self._get_chunk_directory(file_path)
+        return chunk_dir / CHUNKS_DATA_FILE_NAME
+
     def _get_chunk_file_path(self, file_path: str, position: int) -> Path:
         """
-        チャンクファイルのパスを取得する
+        チャンクファイル（旧形式: チャンクごとの個別ファイル）のパスを取得する
 
         Args:
             file_path: 元ファイルパス
@@ -108,6 +214,7 @@ class ChunkFileManager:
         file_path: str,
         last_processed_position: int = -1,
         error_message: str = "",
+        durable: bool = False,
     ) -> None:
         """
         チャンクリストをファイルに保存する
@@ -117,6 +224,8 @@ class ChunkFileManager:
             file_path: 元ファイルパス
             last_processed_position: 最後に処理された位置（-1の場合は未処理）
             error_message: エラーメッセージ
+            durable: Trueの場合、保存完了時にデータファイル・メタデータ・
+                ディレクトリをそれぞれ1回だけfsyncする
 
         Raises:
             OSError: ファイル保存に失敗した場合
@@ -129,13 +238,28 @@ class ChunkFileManager:
         chunk_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            # 各チャンクを個別ファイルに保存
+            # 全チャンクを1つのデータファイルに連結して保存し、
+            # 位置ごとの [position, offset, length] をインデックスとして記録
+            chunk_index = []
+            encoded_chunks = []
+            offset = 0
             for chunk in chunks:
                 position = chunk.metadata.get("position", 0)
-                chunk_file = self._get_chunk_file_path(file_path, position)
-
-                with open(chunk_file, "w", encoding="utf-8") as f:
-                    f.write(chunk.to_json())
+                encoded = _dumps_json(chunk.to_dict(), indent=False)
+                chunk_index.append([position, offset, len(encoded)])
+                encoded_chunks.append(encoded)
+                offset += len(encoded)
+
+            # チャンク本文は自然言語テキストのため、圧縮して書き込み量を減らす
+            # （インデックスのoffset/lengthは圧縮前のデータに対する値）
+            chunks_data = zlib.compress(b"".join(encoded_chunks))
+            chunks_data_file = self._get_chunks_data_file_path(file_path)
+            with open(chunks_data_file, "wb") as f:
+                _preallocate(f.fileno(), len(chunks_data))
+                f.write(chunks_data)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
 
             # メタデータファイルを保存
             metadata = {
@@ -144,11 +268,22 @@ class ChunkFileManager:
                 "last_processed_position": last_processed_position,
                 "created_at": datetime.now().isoformat(),
                 "error_message": error_message,
+                "compression": CHUNKS_DATA_COMPRESSION,
+                "chunk_index": chunk_index,
             }
 
             metadata_file = self._get_metadata_file_path(file_path)
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            with open(metadata_file, "wb") as f:
+                f.write(_dumps_json(metadata, indent=False))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            # 旧形式の個別チャンクファイルは新しいインデックスで不要になるため削除
+            self._remove_legacy_chunk_files(chunk_dir)
+
+            if durable:
+                self._fsync_directory(chunk_dir)
 
             self._logger.info(
                 f"💾 チャンク保存完了: {file_path} "
@@ -159,6 +294,31 @@ class ChunkFileManager:
             self._logger.error(f"❌ チャンク保存失敗: {file_path} - {e}")
             raise
 
+    def _remove_legacy_chunk_files(self, chunk_dir: Path) -> None:
+        """
+        チャンクディレクトリから旧形式の個別チャンクファイル（chunk_*.json）を削除する
+
+        Args:
+            chunk_dir: チャンクディレクトリ
+
+        Raises:
+            OSError: ファイル削除に失敗した場合
+        """
+        with os.scandir(chunk_dir) as entries:
+            legacy_files = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("chunk_")
+                and entry.name.endswith(".json")
+                and entry.is_file()
+            ]
+        for legacy_file in legacy_files:
+            try:
+                os.unlink(legacy_file)
+            except FileNotFoundError:
+                # 他のスレッドが削除済み
+                pass
+
     def load_chunks(self, file_path: str) -> Tuple[List[Chunk], Dict[str, Any]]:
         """
         ファイルパスに対応するチャンクを読み込む
@@ -173,6 +333,7 @@ class ChunkFileManager:
             FileNotFoundError: チャンクファイルが存在しない場合
             OSError: ファイル読み込みに失敗した場合
             json.JSONDecodeError: JSON解析に失敗した場合
+            zlib.error: チャンクデータファイルの展開に失敗した場合
         """
         metadata_file = self._get_metadata_file_path(file_path)
 
@@ -181,25 +342,25 @@ class ChunkFileManager:
 
         try:
             # メタデータを読み込み
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            metadata = _loads_json(metadata_file.read_bytes())
 
-            # 各チャンクファイルを読み込み
             chunks = []
             total_chunks = metadata.get("total_chunks", 0)
-
-            for position in range(total_chunks):
-                chunk_file = self._get_chunk_file_path(file_path, position)
-
-                if chunk_file.exists():
-                    with open(chunk_file, "r", encoding="utf-8") as f:
-                        chunk_json = f.read()
-                        chunk = Chunk.from_json(chunk_json)
-                        chunks.append(chunk)
-                else:
-                    self._logger.warning(
-                        f"⚠️ チャンクファイルが見つかりません: {chunk_file}"
-                    )
+            chunk_index = metadata.get("chunk_index")
+
+            if chunk_index is not None:
+                # データファイルを一度だけ読み込み、インデックスに従って切り出す
+                # （バイト列のままJSON解析し、文字列へのデコードを挟まない）
+                chunks_data_file = self._get_chunks_data_file_path(file_path)
+                data = chunks_data_file.read_bytes()
+                if metadata.get("compression") == CHUNKS_DATA_COMPRESSION:
+                    data = zlib.decompress(data)
+                for _position, offset, length in sorted(chunk_index):
+                    chunk_data = _loads_json(data[offset : offset + length])
+                    chunks.append(Chunk.from_dict(chunk_data))
+            else:
+                # インデックスがない旧形式は各チャンクファイルを読み込み
+                chunks = self._load_legacy_chunk_files(file_path, total_chunks)
 
             self._logger.info(
                 f"📁 チャンク読み込み完了: {file_path} "
@@ -208,10 +369,59 @@ class ChunkFileManager:
 
             return chunks, metadata
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, json.JSONDecodeError, zlib.error) as e:
             self._logger.error(f"❌ チャンク読み込み失敗: {file_path} - {e}")
             raise
 
+    def _load_legacy_chunk_files(
+        self, file_path: str, total_chunks: int
+    ) -> List[Chunk]:
+        """
+        旧形式（チャンクごとの個別ファイル）のチャンクを読み込む
+
+        Args:
+            file_path: 元ファイルパス
+            total_chunks: チャンク総数
+
+        Returns:
+            List[Chunk]: 読み込んだチャンクのリスト
+        """
+        chunk_files = []
+        for position in range(total_chunks):
+            chunk_file = self._get_chunk_file_path(file_path, position)
+
+            if chunk_file.exists():
+                chunk_files.append(chunk_file)
+            else:
+                self._logger.warning(
+                    f"⚠️ チャンクファイルが見つかりません: {chunk_file}"
+                )
+
+        # 読み込みは並列に行い、復元はメインスレッドで順番に行う
+        return [
+            Chunk.from_dict(_loads_json(raw)) for raw in self._read_files(chunk_files)
+        ]
+
+    def _read_files(self, files: List[Path]) -> List[bytes]:
+        """
+        複数ファイルの内容を入力順に読み込む
+
+        ファイル数が少ない場合は逐次、それ以外はスレッドプールで並列に読み込む。
+
+        Args:
+            files: 読み込むファイルのリスト
+
+        Returns:
+            List[bytes]: 各ファイルの内容（filesと同じ順序）
+        """
+        if len(files) < PARALLEL_READ_MIN_FILES:
+            return [f.read_bytes() for f in files]
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_READ_WORKERS, len(files))
+        ) as executor:
+            return list(executor.map(Path.read_bytes, files))
+
     def delete_all_chunks(self, file_path: str) -> None:
         """
         指定ファイルのすべてのチャンクファイルを削除する
@@ -254,8 +464,7 @@ class ChunkFileManager:
             return None
 
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _loads_json(metadata_file.read_bytes())
         except (OSError, json.JSONDecodeError) as e:
             self._logger.warning(f"⚠️ メタデータ読み込み失敗: {file_path} - {e}")
             return None
@@ -274,13 +483,18 @@ class ChunkFileManager:
         total_chunks = 0
         total_size = 0
 
-        for chunk_dir in self._chunks_directory.iterdir():
-            if chunk_dir.is_dir():
-                total_files += 1
+        # os.scandirはディレクトリ読み込み時の種別情報を使うため、
+        # エントリごとの追加statやPath生成が不要
+        with os.scandir(self._chunks_directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    total_files += 1
 
-                dir_total_chunks, dir_total_size = self._aggregate_chunk_data(chunk_dir)
-                total_chunks += dir_total_chunks
-                total_size += dir_total_size
+                    dir_total_chunks, dir_total_size = self._aggregate_chunk_data(
+                        Path(entry.path)
+                    )
+                    total_chunks += dir_total_chunks
+                    total_size += dir_total_size
 
         return {
             "total_cached_files": total_files,
@@ -291,13 +505,37 @@ class ChunkFileManager:
     def _aggregate_chunk_data(self, chunk_dir):
         total_chunks = 0
         total_size = 0
-        for chunk_file in chunk_dir.iterdir():
-            if chunk_file.is_file() and chunk_file.suffix == ".json":
-                if chunk_file.name.startswith("chunk_"):
-                    total_chunks += 1
-                total_size += chunk_file.stat().st_size
+        with os.scandir(chunk_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                if name.endswith(".json"):
+                    if name.startswith("chunk_"):
+                        total_chunks += 1
+                    total_size += entry.stat().st_size
+                elif name == CHUNKS_DATA_FILE_NAME:
+                    # 連結形式はメタデータのインデックス件数をチャンク数とする
+                    total_chunks += len(self._read_chunk_index(chunk_dir))
+                    total_size += entry.stat().st_size
         return total_chunks, total_size
 
+    def _read_chunk_index(self, chunk_dir: Path) -> List[List[int]]:
+        """
+        チャンクディレクトリのメタデータからチャンクインデックスを読み込む
+
+        Args:
+            chunk_dir: チャンクディレクトリ
+
+        Returns:
+            List[List[int]]: [position, offset, length] のリスト（読み込めない場合は空）
+        """
+        try:
+            metadata = _loads_json((chunk_dir / "metadata.json").read_bytes())
+            return metadata.get("chunk_index") or []
+        except (OSError, json.JSONDecodeError):
+            return []
+
     # ===== エピソードデータ永続化管理 =====
 
     def save_episodes(
@@ -305,6 +543,7 @@ class ChunkFileManager:
         file_path: str,
         episodes: List,
         start_index: int = 0,
+        durable: bool = False,
     ) -> None:
         """
         エピソードリストをファイルに保存する
@@ -313,6 +552,8 @@ class ChunkFileManager:
             file_path: 元ファイルパス
             episodes: 保存するエピソードのリスト
             start_index: 開始インデックス
+            durable: Trueの場合、各エピソードファイルをfsyncし、
+                最後にディレクトリを1回だけfsyncする
 
         Raises:
             OSError: ファイル保存に失敗した場合
@@ -325,25 +566,40 @@ class ChunkFileManager:
         chunk_dir.mkdir(parents=True, exist_ok=True)
 
         try:
+            # 同一ドキュメントのエピソードは同じreference_timeオブジェクトを共有するため、
+            # ISO形式への変換は直前と異なるオブジェクトの場合のみ行う
+            last_reference_time = None
+            reference_time_iso = None
+
             # 各エピソードを個別ファイルに保存
             for i, episode in enumerate(episodes):
                 episode_index = start_index + i
                 episode_file = self._get_episode_file_path(file_path, episode_index)
 
+                if episode.reference_time is not last_reference_time:
+                    last_reference_time = episode.reference_time
+                    reference_time_iso = (
+                        last_reference_time.isoformat() if last_reference_time else None
+                    )
+
                 # エピソードを辞書形式に変換
                 episode_data = {
                     "name": episode.name,
                     "body": episode.body,
                     "source_description": episode.source_description,
-                    "reference_time": episode.reference_time.isoformat()
-                    if episode.reference_time
-                    else None,
+                    "reference_time": reference_time_iso,
                     "episode_type": episode.episode_type,
                     "group_id": episode.group_id.value,
                 }
 
-                with open(episode_file, "w", encoding="utf-8") as f:
-                    json.dump(episode_data, f, ensure_ascii=False, indent=2)
+                with open(episode_file, "wb") as f:
+                    f.write(_dumps_json(episode_data))
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+
+            if durable:
+                self._fsync_directory(chunk_dir)
 
             self._logger.info(
                 f"💾 エピソードファイル保存完了: {file_path} "
@@ -386,21 +642,27 @@ class ChunkFileManager:
             if end_index is None:
                 end_index = start_index + 1000  # 上限を設定して無限ループを防ぐ
 
+            existing_episode_files = self._list_episode_files(file_path)
+            episode_files = []
             for episode_index in range(start_index, end_index + 1):
-                episode_file = self._get_episode_file_path(file_path, episode_index)
+                episode_file = existing_episode_files.get(episode_index)
 
-                if not episode_file.exists():
+                if episode_file is None:
                     # end_indexが指定されていない場合は、ファイルが見つからなくなったら終了
                     if end_index == start_index + 1000:
                         break
                     # end_indexが指定されている場合は警告
+                    missing_file = self._get_episode_file_path(file_path, episode_index)
                     self._logger.warning(
-                        f"⚠️ エピソードファイルが見つかりません: {episode_file}"
+                        f"⚠️ エピソードファイルが見つかりません: {missing_file}"
                     )
                     continue
 
-                with open(episode_file, "r", encoding="utf-8") as f:
-                    episode_data = json.load(f)
+                episode_files.append(episode_file)
+
+            # 読み込みは並列に行い、復元はメインスレッドで順番に行う
+            for raw in self._read_files(episode_files):
+                episode_data = _loads_json(raw)
 
                 # エピソードオブジェクトを復元
                 episode = Episode(
@@ -428,6 +690,48 @@ class ChunkFileManager:
             self._logger.error(f"❌ エピソードファイル読み込み失敗: {file_path} - {e}")
             raise
 
+    def _list_episode_files(self, file_path: str) -> Dict[int, Path]:
+        """
+        チャンクディレクトリ内のエピソードファイルを一覧取得する
+
+        インデックスごとに存在確認（stat）する代わりに、ディレクトリを1回だけ読む。
+
+        Args:
+            file_path: 元ファイルパス
+
+        Returns:
+            Dict[int, Path]: エピソードインデックスとファイルパスの対応
+        """
+        chunk_dir = self._get_chunk_directory(file_path)
+        episode_files = {}
+        try:
+            with os.scandir(chunk_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith("episode_") and name.endswith(".json")):
+                        continue
+                    try:
+                        episode_index = int(name[len("episode_") : -len(".json")])
+                    except ValueError:
+                        continue
+                    episode_files[episode_index] = Path(entry.path)
+        except FileNotFoundError:
+            pass
+        return episode_files
+
+    def _fsync_directory(self, directory: Path) -> None:
+        """
+        ディレクトリをfsyncし、ファイルの作成・置換を永続化する
+
+        Args:
+            directory: 対象ディレクトリ
+        """
+        dir_fd = os.open(str(directory), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
     def has_saved_episodes(self, file_path: str) -> bool:
         """
         指定ファイルの保存済みエピソードファイルが存在するかチェックする
@@ -468,10 +772,11 @@ class ChunkFileManager:
             if end_index is None:
                 end_index = start_index + 1000  # 上限を設定
 
+            existing_episode_files = self._list_episode_files(file_path)
             for episode_index in range(start_index, end_index + 1):
-                episode_file = self._get_episode_file_path(file_path, episode_index)
+                episode_file = existing_episode_files.get(episode_index)
 
-                if episode_file.exists():
+                if episode_file is not None:
                     episode_file.unlink()
                     deleted_count += 1
                     self._logger.debug(f"🗑️ エピソードファイル削除: {episode_file}")
@@ -494,26 +799,29 @@ class ChunkFileManager:
 
     def _cleanup_empty_directories(self, directory: Path) -> None:
         """
-        空のディレクトリを再帰的に削除する（chunks_directoryまでは削除しない）
+        空のディレクトリを親方向に削除する（chunks_directoryまでは削除しない）
+
+        空かどうかはディレクトリを読まずにrmdirの成否で判定する
+        （空でない場合はENOTEMPTYで失敗するため、そこで終了する）。
 
         Args:
             directory: 削除対象のディレクトリ
         """
-        if not directory.exists() or not directory.is_dir():
-            return
-
         # chunks_directory以下のディレクトリのみ削除対象
-        if not directory.is_relative_to(self._chunks_directory):
-            return
-
-        try:
-            # ディレクトリが空で、chunks_directoryではない場合に削除
-            if not any(directory.iterdir()) and directory != self._chunks_directory:
-                directory.rmdir()
-                self._logger.debug(f"🗑️ 空ディレクトリ削除: {directory}")
-
-                # 親ディレクトリも確認（再帰的）
-                self._cleanup_empty_directories(directory.parent)
-
-        except OSError as e:
-            self._logger.debug(f"ディレクトリ削除失敗: {directory} - {e}")
+        while directory != self._chunks_directory and directory.is_relative_to(
+            self._chunks_directory
+        ):
+            try:
+                os.rmdir(directory)
+            except OSError as e:
+                if e.errno not in (
+                    errno.ENOTEMPTY,
+                    errno.EEXIST,
+                    errno.ENOENT,
+                    errno.ENOTDIR,
+                ):
+                    self._logger.debug(f"ディレクトリ削除失敗: {directory} - {e}")
+                return
+
+            self._logger.debug(f"🗑️ 空ディレクトリ削除: {directory}")
+            directory = directory.parent
@@ -6,7 +6,7 @@ from datetime import datetime
 import logging
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityCacheEntry:
     """エンティティキャッシュエントリ"""
 
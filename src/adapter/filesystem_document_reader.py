@@ -1,11 +1,19 @@
 """FileSystemDocumentReader - ファイルシステムからの読み込み"""
 
+import errno
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+from src.adapter.parallel_read import MAX_READ_WORKERS, PARALLEL_READ_MIN_FILES
 from src.domain.document import Document
 
+# サポート対象の拡張子（ドット付き、str.endswithにそのまま渡せるようtupleで保持）
+_SUPPORTED_SUFFIXES = tuple(sorted("." + ext for ext in Document.SUPPORTED_FILE_TYPES))
+
 
 class FileSystemDocumentReader:
     """ファイルシステムからドキュメントを読み込むリーダー"""
@@ -38,21 +46,49 @@ class FileSystemDocumentReader:
         if not dir_path.exists():
             raise FileNotFoundError(f"ディレクトリが見つかりません: {directory}")
 
-        file_paths = []
+        return [entry.path for entry in self._iter_supported_entries(directory)]
 
-        # 再帰的にファイルを検索
-        for file_path in dir_path.rglob("*"):
-            if not file_path.is_file():
-                continue
+    def _iter_supported_entries(self, directory: str) -> Iterator[os.DirEntry]:
+        """
+        サポート対象ファイルのDirEntryを再帰的に列挙する
+
+        os.scandirのエントリ種別をそのまま使い、Path生成や追加のstatを行わない。
+        順序はos.walkと同じ（親ディレクトリのファイル → サブディレクトリ）。
 
-            # ファイル拡張子を取得
-            file_extension = file_path.suffix.lstrip(".").lower()
+        Args:
+            directory: 検索対象ディレクトリのパス
 
-            # サポート対象ファイルタイプかチェック
-            if file_extension in Document.SUPPORTED_FILE_TYPES:
-                file_paths.append(str(file_path))
+        Yields:
+            os.DirEntry: サポート対象ファイルのエントリ
+        """
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            subdirectories = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # シンボリックリンク先のディレクトリには降りない
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                            continue
+
+                        # ファイル名の文字列だけでサポート対象の拡張子か判定する
+                        # （".md"のような先頭ドットのみの名前は拡張子なしとして除外）
+                        name = entry.name.lower()
+                        if (
+                            name.endswith(_SUPPORTED_SUFFIXES)
+                            and name.rfind(".") > 0
+                            and entry.is_file()
+                        ):
+                            yield entry
+            except OSError as e:
+                # 読み込めないディレクトリはスキップ（os.walkと同じ挙動）
+                self._logger.debug(f"ディレクトリ読み込み失敗: {current} - {e}")
+                continue
 
-        return file_paths
+            stack.extend(reversed(subdirectories))
 
     def read_document(
         self, file_path: str, base_directory: str | None = None
@@ -74,7 +110,10 @@ class FileSystemDocumentReader:
         return Document.from_file(file_path, base_directory)
 
     def read_documents(
-        self, file_paths: List[str], base_directory: str | None = None
+        self,
+        file_paths: List[str],
+        base_directory: str | None = None,
+        max_workers: int | None = None,
     ) -> List[Document]:
         """
         複数のファイルパスからDocumentリストを読み込む
@@ -82,6 +121,8 @@ class FileSystemDocumentReader:
         Args:
             file_paths: 読み込むファイルパスのリスト
             base_directory: 相対パス計算の基準ディレクトリ（Noneの場合はファイル名のみ使用）
+            max_workers: 並列読み込みの最大スレッド数（Noneの場合はMAX_READ_WORKERS、
+                1の場合は逐次読み込み）
 
         Returns:
             List[Document]: 読み込まれたドキュメントのリスト
@@ -93,16 +134,40 @@ class FileSystemDocumentReader:
         if not file_paths:
             return []
 
-        documents = []
-        for file_path in file_paths:
-            document = self.read_document(file_path, base_directory)
+        read = partial(self._read_and_check_document, base_directory=base_directory)
+
+        if max_workers is None:
+            max_workers = MAX_READ_WORKERS
+
+        if len(file_paths) < PARALLEL_READ_MIN_FILES or max_workers <= 1:
+            return [read(file_path) for file_path in file_paths]
+
+        # 読み込み・デコード中はGILが解放されるため、スレッドで並列に読み込む
+        # （executor.mapは入力順で結果を返す）
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(file_paths))
+        ) as executor:
+            return list(executor.map(read, file_paths))
+
+    def _read_and_check_document(
+        self, file_path: str, base_directory: str | None = None
+    ) -> Document:
+        """
+        ドキュメントを読み込み、ファイルサイズをチェックする
+
+        Args:
+            file_path: 読み込むファイルのパス
+            base_directory: 相対パス計算の基準ディレクトリ
 
-            # ファイルサイズをチェックして大きなファイルの警告を出力
-            self._check_file_size(file_path)
+        Returns:
+            Document: 読み込まれたドキュメント
+        """
+        document = self.read_document(file_path, base_directory)
 
-            documents.append(document)
+        # ファイルサイズをチェックして大きなファイルの警告を出力
+        self._check_file_size(file_path)
 
-        return documents
+        return document
 
     def _check_file_size(self, file_path: str) -> None:
         """
@@ -196,34 +261,41 @@ class FileSystemDocumentReader:
 
     def _cleanup_empty_directories(self, directory: Path) -> None:
         """
-        空のディレクトリを再帰的に削除する（base_directoryまでは削除しない）
+        空のディレクトリを親方向に削除する（base_directoryまでは削除しない）
+
+        空かどうかはディレクトリを読まずにrmdirの成否で判定する
+        （空でない場合はENOTEMPTYで失敗するため、そこで終了する）。
 
         Args:
             directory: 削除対象のディレクトリ
         """
-        if not directory.exists() or not directory.is_dir():
-            return
-
         # base_directoryの親ディレクトリ以下のディレクトリのみ削除対象
         # （input/, work/, done/ すべてを対象にするため）
+        base_path = None
+        root_path = None
         if self._base_directory:
             base_path = Path(self._base_directory)
             # base_directoryの親ディレクトリを基準とする（例: /app/data）
             root_path = base_path.parent
-            if not directory.is_relative_to(root_path):
-                return
-            # base_directoryそのものは削除しない
-            if directory == base_path:
-                return
 
-        try:
-            # ディレクトリが空の場合に削除（base_directoryとroot_path以外）
-            if not any(directory.iterdir()):
-                directory.rmdir()
-                self._logger.debug(f"🗑️ 空ディレクトリ削除: {directory}")
+        while True:
+            if root_path is not None and (
+                # base_directoryそのものは削除しない
+                directory == base_path or not directory.is_relative_to(root_path)
+            ):
+                return
 
-                # 親ディレクトリも確認（再帰的）
-                self._cleanup_empty_directories(directory.parent)
+            try:
+                os.rmdir(directory)
+            except OSError as e:
+                if e.errno not in (
+                    errno.ENOTEMPTY,
+                    errno.EEXIST,
+                    errno.ENOENT,
+                    errno.ENOTDIR,
+                ):
+                    self._logger.debug(f"ディレクトリ削除失敗: {directory} - {e}")
+                return
 
-        except OSError as e:
-            self._logger.debug(f"ディレクトリ削除失敗: {directory} - {e}")
+            self._logger.debug(f"🗑️ 空ディレクトリ削除: {directory}")
+            directory = directory.parent
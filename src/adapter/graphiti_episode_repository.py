@@ -13,6 +13,13 @@ from src.adapter.entity_cache import get_entity_cache
 from src.adapter.rate_limit_retry_handler import RateLimitRetryHandler
 from src.adapter.rate_limit_coordinator import get_rate_limit_coordinator
 
+# episode_typeとEpisodeTypeの対応表
+_EPISODE_TYPE_MAP = {
+    "text": EpisodeType.text,
+    "json": EpisodeType.json,
+    "message": EpisodeType.message,
+}
+
 
 class GraphitiEpisodeRepository:
     """Graphitiを使用したエピソード保存リポジトリ（並列処理対応）"""
@@ -85,6 +92,9 @@ class GraphitiEpisodeRepository:
         # Rate limitコーディネーターの初期化
         self.rate_limit_coordinator = get_rate_limit_coordinator()
 
+        # スレッドID文字列のキャッシュ（threading.get_ident() -> str）
+        self._thread_id_cache: Dict[int, str] = {}
+
         self._logger.info(f"🔗 Graphitiクライアント初期化完了 - Neo4j: {neo4j_uri}")
         self._logger.info("📋 エンティティキャッシュ初期化完了")
         self._logger.info("🔄 Rate Limitスレッド同期コーディネーター初期化完了")
@@ -111,25 +121,27 @@ class GraphitiEpisodeRepository:
         Raises:
             Exception: Graphitiでエラーが発生した場合
         """
-        # スレッドIDを取得
-        thread_id = str(threading.current_thread().ident or "unknown")
+        # スレッドIDを取得（文字列化はスレッドごとに1回だけ行う）
+        ident = threading.get_ident()
+        thread_id = self._thread_id_cache.get(ident)
+        if thread_id is None:
+            thread_id = self._thread_id_cache.setdefault(ident, str(ident))
 
         # Rate Limit状態をチェックし、必要に応じて待機
         await self.rate_limit_coordinator.check_and_wait_if_needed(thread_id)
 
         # episode_typeを対応するEpisodeTypeに変換
-        episode_type_mapping = {
-            "text": EpisodeType.text,
-            "json": EpisodeType.json,
-            "message": EpisodeType.message,
-        }
-
-        source_type = episode_type_mapping.get(episode.episode_type, EpisodeType.text)
-
-        self._logger.debug(f"💾 エピソード保存開始: {episode.name}")
-        self._logger.debug(f"  - group_id: {episode.group_id.value}")
-        self._logger.debug(f"  - episode_type: {episode.episode_type} -> {source_type}")
-        self._logger.debug(f"  - body_length: {len(episode.body)}")
+        source_type = _EPISODE_TYPE_MAP.get(episode.episode_type, EpisodeType.text)
+
+        # DEBUG無効時はメッセージの組み立て自体を省略する
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self._logger.debug(f"💾 エピソード保存開始: {episode.name}")
+            self._logger.debug(f"  - group_id: {episode.group_id.value}")
+            self._logger.debug(
+                f"  - episode_type: {episode.episode_type} -> {source_type}"
+            )
+            self._logger.debug(f"  - body_length: {len(episode.body)}")
 
         # エラー別のリトライカウンター
         rate_limit_attempts = 0
@@ -145,7 +157,8 @@ class GraphitiEpisodeRepository:
                     source=source_type,
                     group_id=episode.group_id.value,
                 )
-                self._logger.debug(f"✅ エピソード保存完了: {episode.name}")
+                if debug_enabled:
+                    self._logger.debug(f"✅ エピソード保存完了: {episode.name}")
                 return
             except RateLimitError as e:
                 if rate_limit_attempts < self.retry_handler.max_retries:
@@ -1,8 +1,8 @@
 """ロギングユーティリティ - スレッド別・ファイル別のコンテキスト管理"""
 
 import logging
-import threading
 from contextvars import ContextVar
+from functools import lru_cache
 from typing import Optional, Any
 
 
@@ -10,6 +10,35 @@ from typing import Optional, Any
 current_file: ContextVar[Optional[str]] = ContextVar("current_file", default=None)
 
 
+@lru_cache(maxsize=1024)
+def _file_context(file_name: str) -> str:
+    """
+    ファイルパスからログ表示用のファイルコンテキストを作成する（結果はキャッシュ）
+
+    Args:
+        file_name: ファイルパス
+
+    Returns:
+        str: 拡張子を除いた短いファイル名（例: "[sample]"）
+    """
+    short_name = file_name.rpartition("/")[2].partition(".")[0][:20]
+    return f"[{short_name}]"
+
+
+@lru_cache(maxsize=1024)
+def _thread_name(thread_id: int) -> str:
+    """
+    スレッドIDからログ表示用のスレッド名を作成する（結果はキャッシュ）
+
+    Args:
+        thread_id: スレッドID
+
+    Returns:
+        str: スレッド名（例: "[T042]"）
+    """
+    return f"[T{thread_id % 1000:03d}]"
+
+
 class FileContextFilter(logging.Filter):
     """ファイルコンテキストをログレコードに追加するフィルター"""
 
@@ -29,15 +58,14 @@ class FileContextFilter(logging.Filter):
         # 常にコンテキスト情報を設定（空でもプレースホルダーを表示）
         if file_name:
             # ファイル名から拡張子を除いた短い名前を作成
-            short_name = file_name.split("/")[-1].split(".")[0][:20]
-            record.file_context = f"[{short_name}]"
+            record.file_context = _file_context(file_name)
         else:
             record.file_context = "[--------]"
 
-        # スレッドIDは常に表示
-        thread_id = threading.current_thread().ident
+        # スレッドIDは常に表示（LogRecord生成時に取得済みのIDを使用）
+        thread_id = record.thread
         if thread_id:
-            record.thread_name = f"[T{thread_id % 1000:03d}]"
+            record.thread_name = _thread_name(thread_id)
         else:
             record.thread_name = "[T---]"
 
@@ -0,0 +1,6 @@
+"""並列ファイル読み込みの共通設定"""
+
+# 複数ファイルをスレッドプールで並列に読み込む最小ファイル数と最大スレッド数
+# （ChunkFileManager・FileSystemDocumentReaderで共通）
+PARALLEL_READ_MIN_FILES = 4
+MAX_READ_WORKERS = 32
@@ -1,9 +1,14 @@
 """Document値オブジェクト"""
 
+import mmap
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Set, ClassVar
 
+# このサイズ以上のファイルはmmapで読み込む（bytesへの中間コピーを避ける）
+MMAP_MIN_FILE_SIZE = 32 * 1024 * 1024
+
 
 class Document:
     """文書を表す値オブジェクト"""
@@ -132,22 +137,31 @@ class Document:
             ValueError: サポートされていないファイルタイプの場合
         """
         path = Path(file_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
-
         file_name = path.name
         file_type = path.suffix.lstrip(".").lower()
 
-        # ファイル内容を読み込み
+        # ファイルを1回だけ開き、更新日時と内容を同じディスクリプタから取得
         try:
-            content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # バイナリファイルの場合は内容を文字列として表現
-            content = f"<バイナリファイル: {file_name}>"
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}") from e
+        try:
+            file_stat = os.fstat(fd)
+            if file_stat.st_size >= MMAP_MIN_FILE_SIZE:
+                # 大きなファイルはmmapし、bytesへコピーせずにページキャッシュから直接デコード
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    content = cls._decode_content(mapped, file_name)
+            else:
+                parts = [os.read(fd, file_stat.st_size)]
+                # 1回で読み切れない場合（読み込み中の追記など）はEOFまで読む
+                while part := os.read(fd, 1024 * 1024):
+                    parts.append(part)
+                content = cls._decode_content(b"".join(parts), file_name)
+        finally:
+            os.close(fd)
 
         # ファイルの最終更新日時を取得
-        file_last_modified = datetime.fromtimestamp(path.stat().st_mtime)
+        file_last_modified = datetime.fromtimestamp(file_stat.st_mtime)
 
         # 相対パスを計算
         if base_directory:
@@ -170,6 +184,24 @@ class Document:
             relative_path=relative_path,
         )
 
+    @staticmethod
+    def _decode_content(data, file_name: str) -> str:
+        """
+        ファイル内容をUTF-8としてデコードする（read_textと同様に改行コードを"\n"に統一）
+
+        Args:
+            data: ファイル内容（bytesまたはmmapなどのバッファ）
+            file_name: ファイル名
+
+        Returns:
+            str: デコードした内容（バイナリファイルの場合はプレースホルダー）
+        """
+        try:
+            return str(data, "utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError:
+            # バイナリファイルの場合は内容を文字列として表現
+            return f"<バイナリファイル: {file_name}>"
+
     def __eq__(self, other: object) -> bool:
         """等価性判定"""
         if not isinstance(other, Document):
@@ -3,6 +3,7 @@
 import logging
 import multiprocessing
 import time
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Any, Dict
@@ -13,6 +14,7 @@ from src.adapter.filesystem_document_reader import FileSystemDocumentReader
 from src.adapter.unstructured_document_parser import UnstructuredDocumentParser
 from src.adapter.graphiti_episode_repository import GraphitiEpisodeRepository
 from src.adapter.chunk_file_manager import ChunkFileManager
+from src.adapter.logging_utils import current_file
 
 
 @dataclass
@@ -105,10 +107,8 @@ class RegisterDocumentUseCase:
         Returns:
             Tuple[List, int, str]: (エピソードリスト, チャンク数, エラーファイルパス)
         """
-        from src.adapter.logging_utils import current_file
-
-        # 現在処理中のファイルをコンテキストに設定
-        current_file.set(document.file_path)
+        # 現在処理中のファイルをコンテキストに設定（処理後に元へ戻す）
+        token = current_file.set(document.file_path)
 
         try:
             self._logger.info(
@@ -242,6 +242,8 @@ class RegisterDocumentUseCase:
             error_msg = f"❌ ファイル処理失敗: {document.file_path} - {e}"
             self._logger.error(error_msg)
             return [], 0, document.file_path
+        finally:
+            current_file.reset(token)
 
     async def execute(
         self,
@@ -460,12 +462,16 @@ class RegisterDocumentUseCase:
             bool: エピソード保存の成功/失敗
         """
         # エピソードをファイル別にグループ化
-        episodes_by_file = {}
+        # ドキュメントのファイル名はエピソードごとではなく1回だけ求める
+        document_names = [
+            (Path(doc.file_path).name, doc.file_path) for doc in documents
+        ]
+        episodes_by_file = defaultdict(list)
         for episode in all_episodes:
             # エピソード名からファイルパスを抽出（仮の実装）
-            source_file = self._extract_source_file_from_episode(episode, documents)
-            if source_file not in episodes_by_file:
-                episodes_by_file[source_file] = []
+            source_file = self._extract_source_file_from_episode(
+                episode, document_names
+            )
             episodes_by_file[source_file].append(episode)
 
         # ファイルごとに分割保存を実行
@@ -578,30 +584,37 @@ class RegisterDocumentUseCase:
         # セマフォで同時実行数を制限
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def save_single_with_semaphore(episode_index: int, episode):
-            async with semaphore:
-                await self._save_single_episode_with_progress(
-                    file_path, episode_index, episode, total_episodes
+        async def save_single_with_semaphore(episode_index: int, episode) -> bool:
+            try:
+                async with semaphore:
+                    await self._save_single_episode_with_progress(
+                        file_path, episode_index, episode, total_episodes
+                    )
+                return True
+            except Exception as e:
+                # 例外が発生しても他のタスクを継続し、完了時点でログ出力
+                self._logger.error(
+                    f"❌ エピソード保存失敗: {file_path} [index:{episode_index}] {episode.name} - {e}"
                 )
+                return False
 
         # 全エピソードの保存タスクを作成
-        tasks = []
-        for episode_index, episode in remaining_episodes:
-            task = save_single_with_semaphore(episode_index, episode)
-            tasks.append(task)
-
-        # 並列実行（例外が発生しても他のタスクを継続）
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            asyncio.ensure_future(save_single_with_semaphore(episode_index, episode))
+            for episode_index, episode in remaining_episodes
+        ]
 
-        # 結果を確認し、エラーがあればログ出力
+        # 完了したものから順に結果を確認する
         error_count = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                episode_index, episode = remaining_episodes[i]
-                self._logger.error(
-                    f"❌ エピソード保存失敗: {file_path} [index:{episode_index}] {episode.name} - {result}"
-                )
-                error_count += 1
+        try:
+            for completed in asyncio.as_completed(tasks):
+                if not await completed:
+                    error_count += 1
+        finally:
+            # 呼び出し側のキャンセル等で途中終了した場合、残りの保存を止める
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
         if error_count > 0:
             self._logger.warning(
@@ -631,47 +644,56 @@ class RegisterDocumentUseCase:
         Raises:
             Exception: 保存に失敗した場合
         """
-        # ファイルコンテキストを設定
-        from src.adapter.logging_utils import current_file
-
-        current_file.set(file_path)
+        # ファイルコンテキストを設定（保存後に元へ戻す）
+        token = current_file.set(file_path)
 
-        self._logger.debug(
-            f"📝 エピソード保存中 [{episode_index}/{total_episodes - 1}]: {episode.name}"
-        )
-
-        # エピソードを保存（ここで例外が発生する可能性がある）
-        await self._episode_repository.save(episode)
+        try:
+            # DEBUG無効時はメッセージの組み立て自体を省略する
+            debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                self._logger.debug(
+                    f"📝 エピソード保存中 [{episode_index}/{total_episodes - 1}]: {episode.name}"
+                )
 
-        # 保存完了後、対応するエピソードファイルを削除
-        self._chunk_file_manager.delete_episode_files(
-            file_path, episode_index, episode_index
-        )
+            # エピソードを保存（ここで例外が発生する可能性がある）
+            await self._episode_repository.save(episode)
 
-        self._logger.debug(f"✅ エピソード保存成功 [{episode_index}]: {episode.name}")
+            # 保存完了後、対応するエピソードファイルを削除
+            self._chunk_file_manager.delete_episode_files(
+                file_path, episode_index, episode_index
+            )
 
-        # 全エピソード処理完了チェック（input_work→input_done移動）
-        if not self._chunk_file_manager.has_saved_episodes(file_path):
-            # input_work/ディレクトリのファイルのみ移動対象
-            if self.WORK_DIR in file_path:
-                done_directory = file_path.replace(self.WORK_DIR, f"{self.DONE_DIR}/")
-                # ディレクトリ部分のみ抽出
-                done_dir = str(Path(done_directory).parent)
+            if debug_enabled:
+                self._logger.debug(
+                    f"✅ エピソード保存成功 [{episode_index}]: {episode.name}"
+                )
 
-                try:
-                    self._file_reader.move_file(file_path, done_dir)
-                    self._logger.info(
-                        f"📁 完了ファイル移動: {Path(file_path).name} → input_done/"
-                    )
-                except FileNotFoundError:
-                    # 既に他のスレッドが移動済み
-                    self._logger.debug(
-                        f"📁 ファイル既に移動済み: {Path(file_path).name}"
-                    )
-                except Exception as e:
-                    self._logger.warning(
-                        f"⚠️ ファイル移動失敗: {Path(file_path).name} - {e}"
+            # 全エピソード処理完了チェック（input_work→input_done移動）
+            if not self._chunk_file_manager.has_saved_episodes(file_path):
+                # input_work/ディレクトリのファイルのみ移動対象
+                if self.WORK_DIR in file_path:
+                    done_directory = file_path.replace(
+                        self.WORK_DIR, f"{self.DONE_DIR}/"
                     )
+                    # ディレクトリ部分のみ抽出
+                    done_dir = str(Path(done_directory).parent)
+
+                    try:
+                        self._file_reader.move_file(file_path, done_dir)
+                        self._logger.info(
+                            f"📁 完了ファイル移動: {Path(file_path).name} → input_done/"
+                        )
+                    except FileNotFoundError:
+                        # 既に他のスレッドが移動済み
+                        self._logger.debug(
+                            f"📁 ファイル既に移動済み: {Path(file_path).name}"
+                        )
+                    except Exception as e:
+                        self._logger.warning(
+                            f"⚠️ ファイル移動失敗: {Path(file_path).name} - {e}"
+                        )
+        finally:
+            current_file.reset(token)
 
     async def _save_work_episodes_with_progress(
         self,
@@ -691,13 +713,15 @@ class RegisterDocumentUseCase:
                 file_path, file_episodes, max_concurrent
             )
 
-    def _extract_source_file_from_episode(self, episode, documents: List) -> str:
+    def _extract_source_file_from_episode(
+        self, episode, document_names: List[Tuple[str, str]]
+    ) -> str:
         """
         エピソードから元ファイルパスを抽出する
 
         Args:
             episode: エピソード
-            documents: ドキュメントリスト
+            document_names: (ファイル名, ファイルパス)のタプルのリスト
 
         Returns:
             str: 元ファイルパス
@@ -706,13 +730,13 @@ class RegisterDocumentUseCase:
         episode_name = episode.name
 
         # ドキュメントリストから対応するファイルパスを探す
-        for doc in documents:
-            file_name = Path(doc.file_path).name
+        for file_name, file_path in document_names:
             if file_name in episode_name:
-                return doc.file_path
+                return file_path
 
-        # 見つからない場合はエピソード名をそのまま使用
-        return episode_name.split(" - ")[0] if " - " in episode_name else episode_name
+        # 見つからない場合はエピソード名のファイル名部分を使用
+        # （区切りがなければpartitionはエピソード名をそのまま返す）
+        return episode_name.partition(" - ")[0]
 
     def _build_error_message(
         self, chunking_success: bool, episode_save_success: bool
@@ -0,0 +1,351 @@
+"""ChunkFileManagerのテスト"""
+
+import json
+import shutil
+import tempfile
+import zlib
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.adapter.chunk_file_manager import CHUNKS_DATA_FILE_NAME, ChunkFileManager
+from src.domain.chunk import Chunk
+from src.domain.document import Document
+from src.domain.episode import Episode
+from src.domain.group_id import GroupId
+
+
+@pytest.fixture
+def temp_dir():
+    """一時ディレクトリを作成"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def source_document():
+    """テスト用のソースドキュメント"""
+    return Document(
+        file_path="/input/docs/sample.txt",
+        file_name="sample.txt",
+        file_type="txt",
+        content="サンプル本文",
+        file_last_modified=datetime(2025, 6, 13, 10, 0, 0),
+        relative_path="docs/sample.txt",
+    )
+
+
+def create_chunks(source_document, count):
+    """テスト用のチャンクリストを作成する"""
+    return [
+        Chunk(
+            id=f"sample_txt_chunk_{i}",
+            text=f"チャンク{i}の本文",
+            metadata={"position": i},
+            source_document=source_document,
+        )
+        for i in range(count)
+    ]
+
+
+def create_episodes(count):
+    """テスト用のエピソードリストを作成する"""
+    return [
+        Episode(
+            name=f"sample.txt - chunk_{i}",
+            body=f"チャンク{i}の本文",
+            source_description="Source file: sample.txt",
+            reference_time=datetime(2025, 6, 13, 10, 0, 0),
+            episode_type="text",
+            group_id=GroupId("test"),
+        )
+        for i in range(count)
+    ]
+
+
+class TestChunkFileManager:
+    """ChunkFileManagerのテスト"""
+
+    def test_save_chunks_複数チャンクを保存した場合_1つのデータファイルにまとめられること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 3)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        manager.save_chunks(chunks, source_document.file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        chunk_dir = manager._get_chunk_directory(source_document.file_path)
+        file_names = sorted(p.name for p in chunk_dir.iterdir())
+        assert file_names == [CHUNKS_DATA_FILE_NAME, "metadata.json"]
+        metadata = manager.get_metadata(source_document.file_path)
+        assert [entry[0] for entry in metadata["chunk_index"]] == [0, 1, 2]
+
+    def test_save_chunks_durable指定の場合_データ_メタデータ_ディレクトリを1回ずつfsyncすること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 5)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        with patch("src.adapter.chunk_file_manager.os.fsync") as mock_fsync:
+            manager.save_chunks(chunks, source_document.file_path, durable=True)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert mock_fsync.call_count == 3
+
+    def test_save_chunks_durable未指定の場合_fsyncしないこと(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 5)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        with patch("src.adapter.chunk_file_manager.os.fsync") as mock_fsync:
+            manager.save_chunks(chunks, source_document.file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        mock_fsync.assert_not_called()
+
+    def test_load_chunks_保存済みチャンクの場合_位置順に復元されること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 3)
+        manager.save_chunks(list(reversed(chunks)), source_document.file_path, 1)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        loaded_chunks, metadata = manager.load_chunks(source_document.file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert [c.id for c in loaded_chunks] == [c.id for c in chunks]
+        assert [c.text for c in loaded_chunks] == [c.text for c in chunks]
+        assert metadata["last_processed_position"] == 1
+
+    def test_load_chunks_非圧縮のデータファイルの場合_そのまま復元されること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 3)
+        manager.save_chunks(chunks, source_document.file_path)
+        chunk_dir = manager._get_chunk_directory(source_document.file_path)
+        data_file = chunk_dir / CHUNKS_DATA_FILE_NAME
+        data_file.write_bytes(zlib.decompress(data_file.read_bytes()))
+        metadata = manager.get_metadata(source_document.file_path)
+        del metadata["compression"]
+        (chunk_dir / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        loaded_chunks, _ = manager.load_chunks(source_document.file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert [c.id for c in loaded_chunks] == [c.id for c in chunks]
+
+    def test_load_chunks_旧形式の個別ファイルの場合_個別ファイルから復元されること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        chunks = create_chunks(source_document, 2)
+        chunk_dir = manager._get_chunk_directory(source_document.file_path)
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for chunk in chunks:
+            position = chunk.metadata["position"]
+            manager._get_chunk_file_path(
+                source_document.file_path, position
+            ).write_text(chunk.to_json(), encoding="utf-8")
+        metadata = {
+            "original_file": source_document.file_path,
+            "total_chunks": len(chunks),
+            "last_processed_position": -1,
+            "created_at": datetime.now().isoformat(),
+            "error_message": "",
+        }
+        (chunk_dir / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        loaded_chunks, _ = manager.load_chunks(source_document.file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert [c.id for c in loaded_chunks] == [c.id for c in chunks]
+
+    def test_save_chunks_旧形式のディレクトリに保存した場合_個別ファイルが削除されること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        file_path = "/input/sample.txt"
+        chunks = create_chunks(source_document, 3)
+        chunk_dir = manager._get_chunk_directory(file_path)
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for chunk in chunks:
+            position = chunk.metadata["position"]
+            manager._get_chunk_file_path(file_path, position).write_text(
+                chunk.to_json(), encoding="utf-8"
+            )
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        manager.save_chunks(chunks, file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        file_names = sorted(p.name for p in chunk_dir.iterdir())
+        assert file_names == [CHUNKS_DATA_FILE_NAME, "metadata.json"]
+        assert manager.get_cache_stats()["total_chunks"] == 3
+        loaded_chunks, _ = manager.load_chunks(file_path)
+        assert [c.id for c in loaded_chunks] == [c.id for c in chunks]
+
+    def test_get_cache_stats_連結形式の場合_インデックス件数がチャンク数となること(
+        self, temp_dir, source_document
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        manager.save_chunks(create_chunks(source_document, 4), "/input/sample.txt")
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        stats = manager.get_cache_stats()
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert stats["total_cached_files"] == 1
+        assert stats["total_chunks"] == 4
+
+    def test_load_episodes_複数エピソードの場合_保存順に復元されること(self, temp_dir):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        file_path = "/input/sample.txt"
+        episodes = create_episodes(6)
+        manager.save_episodes(file_path, episodes)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        loaded_episodes = manager.load_episodes(file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert [e.name for e in loaded_episodes] == [e.name for e in episodes]
+        assert [e.body for e in loaded_episodes] == [e.body for e in episodes]
+
+    def test_load_episodes_end_index未指定で欠番がある場合_欠番の手前まで読み込むこと(
+        self, temp_dir
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        file_path = "/input/sample.txt"
+        manager.save_episodes(file_path, create_episodes(5))
+        manager._get_episode_file_path(file_path, 3).unlink()
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        loaded_episodes = manager.load_episodes(file_path, start_index=1)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert [e.name for e in loaded_episodes] == [
+            "sample.txt - chunk_1",
+            "sample.txt - chunk_2",
+        ]
+
+    def test_delete_episode_files_範囲指定の場合_範囲内のファイルのみ削除されること(
+        self, temp_dir
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        file_path = "/input/sample.txt"
+        manager.save_episodes(file_path, create_episodes(5))
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        manager.delete_episode_files(file_path, 1, 2)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert sorted(manager._list_episode_files(file_path)) == [0, 3, 4]
+
+    def test_delete_episode_files_全エピソードを削除した場合_空ディレクトリがチャンクディレクトリ直下まで削除されること(
+        self, temp_dir
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        manager = ChunkFileManager(temp_dir)
+        file_path = "/input/a/b/sample.txt"
+        manager.save_episodes(file_path, create_episodes(2))
+        (manager._chunks_directory / "other.txt").write_text("x", encoding="utf-8")
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        manager.delete_episode_files(file_path)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert not (manager._chunks_directory / "a").exists()
+        assert manager._chunks_directory.exists()
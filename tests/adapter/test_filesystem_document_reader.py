@@ -1,8 +1,10 @@
 """FileSystemDocumentReaderのテスト"""
 
+import os
+import shutil
+import tempfile
 import pytest
 from unittest.mock import patch
-from pathlib import Path
 from datetime import datetime
 
 from src.adapter.filesystem_document_reader import FileSystemDocumentReader
@@ -30,43 +32,38 @@ class TestFileSystemDocumentReader:
         # 準備 (Arrange)
         # ------------------------------
         reader = FileSystemDocumentReader()
-        directory = "/docs"
-
-        # モックファイル（サポート対象と非対象の混在）
-        mock_files = [
-            Path("/docs/document.pdf"),
-            Path("/docs/text.txt"),
-            Path("/docs/presentation.pptx"),
-            Path("/docs/image.png"),
-            Path("/docs/unsupported.xyz"),  # サポート外
-            Path("/docs/script.py"),  # サポート外
-        ]
-
-        # ------------------------------
-        # 実行 (Act)
-        # ------------------------------
-        with patch("src.adapter.filesystem_document_reader.Path.exists") as mock_exists:
-            mock_exists.return_value = True
-            with patch(
-                "src.adapter.filesystem_document_reader.Path.rglob"
-            ) as mock_rglob:
-                mock_rglob.return_value = mock_files
-                with patch(
-                    "src.adapter.filesystem_document_reader.Path.is_file"
-                ) as mock_is_file:
-                    mock_is_file.return_value = True
-                    file_paths = reader.list_supported_files(directory)
-
-        # ------------------------------
-        # 検証 (Assert)
-        # ------------------------------
-        assert len(file_paths) == 4  # サポート対象のみ
-        assert "/docs/document.pdf" in file_paths
-        assert "/docs/text.txt" in file_paths
-        assert "/docs/presentation.pptx" in file_paths
-        assert "/docs/image.png" in file_paths
-        assert "/docs/unsupported.xyz" not in file_paths
-        assert "/docs/script.py" not in file_paths
+        directory = tempfile.mkdtemp()
+
+        # ファイル（サポート対象と非対象の混在）
+        for name in [
+            "document.pdf",
+            "text.txt",
+            "presentation.pptx",
+            "image.png",
+            "unsupported.xyz",  # サポート外
+            "script.py",  # サポート外
+        ]:
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+                f.write("content")
+
+        try:
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            file_paths = reader.list_supported_files(directory)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert len(file_paths) == 4  # サポート対象のみ
+            assert os.path.join(directory, "document.pdf") in file_paths
+            assert os.path.join(directory, "text.txt") in file_paths
+            assert os.path.join(directory, "presentation.pptx") in file_paths
+            assert os.path.join(directory, "image.png") in file_paths
+            assert os.path.join(directory, "unsupported.xyz") not in file_paths
+            assert os.path.join(directory, "script.py") not in file_paths
+        finally:
+            shutil.rmtree(directory)
 
     def test_list_supported_files_空のディレクトリを指定した場合_空のリストが返されること(
         self,
@@ -75,23 +72,57 @@ class TestFileSystemDocumentReader:
         # 準備 (Arrange)
         # ------------------------------
         reader = FileSystemDocumentReader()
-        directory = "/empty"
-
-        # ------------------------------
-        # 実行 (Act)
-        # ------------------------------
-        with patch("src.adapter.filesystem_document_reader.Path.exists") as mock_exists:
-            mock_exists.return_value = True
-            with patch(
-                "src.adapter.filesystem_document_reader.Path.rglob"
-            ) as mock_rglob:
-                mock_rglob.return_value = []
-                file_paths = reader.list_supported_files(directory)
-
+        directory = tempfile.mkdtemp()
+
+        try:
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            file_paths = reader.list_supported_files(directory)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert len(file_paths) == 0
+        finally:
+            shutil.rmtree(directory)
+
+    def test_list_supported_files_サブディレクトリを含む場合_拡張子の大文字小文字を問わず再帰的に返されること(
+        self,
+    ):
         # ------------------------------
-        # 検証 (Assert)
+        # 準備 (Arrange)
         # ------------------------------
-        assert len(file_paths) == 0
+        reader = FileSystemDocumentReader()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            sub_dir = os.path.join(temp_dir, "sub")
+            os.makedirs(sub_dir)
+            for path in [
+                os.path.join(temp_dir, "top.md"),
+                os.path.join(sub_dir, "REPORT.PDF"),
+                os.path.join(sub_dir, ".md"),  # 拡張子なしのドットファイル
+                os.path.join(sub_dir, "notes.xyz"),  # サポート外
+            ]:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("content")
+
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            file_paths = reader.list_supported_files(temp_dir)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert sorted(file_paths) == sorted(
+                [
+                    os.path.join(temp_dir, "top.md"),
+                    os.path.join(sub_dir, "REPORT.PDF"),
+                ]
+            )
+        finally:
+            shutil.rmtree(temp_dir)
 
     def test_list_supported_files_存在しないディレクトリを指定した場合_例外が発生すること(
         self,
@@ -118,34 +149,31 @@ class TestFileSystemDocumentReader:
         # 準備 (Arrange)
         # ------------------------------
         reader = FileSystemDocumentReader()
-        file_path = "/docs/sample.txt"
-        file_content = "This is sample text content."
-
-        # ------------------------------
-        # 実行 (Act)
-        # ------------------------------
-        with patch("src.adapter.filesystem_document_reader.Path.exists") as mock_exists:
-            mock_exists.return_value = True
-            with patch(
-                "src.adapter.filesystem_document_reader.Path.read_text"
-            ) as mock_read_text:
-                mock_read_text.return_value = file_content
-                with patch(
-                    "src.adapter.filesystem_document_reader.Path.stat"
-                ) as mock_stat:
-                    mock_stat.return_value.st_mtime = (
-                        1672531200.0  # 2023-01-01 00:00:00
-                    )
-                    document = reader.read_document(file_path)
-
-        # ------------------------------
-        # 検証 (Assert)
-        # ------------------------------
-        assert isinstance(document, Document)
-        assert document.file_path == file_path
-        assert document.file_name == "sample.txt"
-        assert document.file_type == "txt"
-        assert document.content == file_content
+        temp_dir = tempfile.mkdtemp()
+        file_path = os.path.join(temp_dir, "sample.txt")
+        file_content = "This is sample text content.\r\n2行目"
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            f.write(file_content)
+        os.utime(file_path, (1672531200.0, 1672531200.0))  # 2023-01-01 00:00:00
+
+        try:
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            document = reader.read_document(file_path)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert isinstance(document, Document)
+            assert document.file_path == file_path
+            assert document.file_name == "sample.txt"
+            assert document.file_type == "txt"
+            # 改行コードは"\n"に統一される
+            assert document.content == "This is sample text content.\n2行目"
+            assert document.file_last_modified == datetime.fromtimestamp(1672531200.0)
+        finally:
+            shutil.rmtree(temp_dir)
 
     def test_read_document_バイナリファイルを読み込んだ場合_適切なDocumentが返されること(
         self,
@@ -154,35 +182,27 @@ class TestFileSystemDocumentReader:
         # 準備 (Arrange)
         # ------------------------------
         reader = FileSystemDocumentReader()
-        file_path = "/docs/sample.pdf"
-
-        # ------------------------------
-        # 実行 (Act)
-        # ------------------------------
-        with patch("src.adapter.filesystem_document_reader.Path.exists") as mock_exists:
-            mock_exists.return_value = True
-            with patch(
-                "src.adapter.filesystem_document_reader.Path.read_text"
-            ) as mock_read_text:
-                mock_read_text.side_effect = UnicodeDecodeError(
-                    "utf-8", b"", 0, 1, "error"
-                )
-                with patch(
-                    "src.adapter.filesystem_document_reader.Path.stat"
-                ) as mock_stat:
-                    mock_stat.return_value.st_mtime = (
-                        1672531200.0  # 2023-01-01 00:00:00
-                    )
-                    document = reader.read_document(file_path)
-
-        # ------------------------------
-        # 検証 (Assert)
-        # ------------------------------
-        assert isinstance(document, Document)
-        assert document.file_path == file_path
-        assert document.file_name == "sample.pdf"
-        assert document.file_type == "pdf"
-        assert "<バイナリファイル: sample.pdf>" in document.content
+        temp_dir = tempfile.mkdtemp()
+        file_path = os.path.join(temp_dir, "sample.pdf")
+        with open(file_path, "wb") as f:
+            f.write(b"%PDF-1.4\n\xff\xfe\x00binary")
+
+        try:
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            document = reader.read_document(file_path)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert isinstance(document, Document)
+            assert document.file_path == file_path
+            assert document.file_name == "sample.pdf"
+            assert document.file_type == "pdf"
+            assert "<バイナリファイル: sample.pdf>" in document.content
+        finally:
+            shutil.rmtree(temp_dir)
 
     def test_read_document_存在しないファイルを指定した場合_例外が発生すること(self):
         # ------------------------------
@@ -194,11 +214,8 @@ class TestFileSystemDocumentReader:
         # ------------------------------
         # 実行 (Act) & 検証 (Assert)
         # ------------------------------
-        with patch("src.adapter.filesystem_document_reader.Path.exists") as mock_exists:
-            mock_exists.return_value = False
-
-            with pytest.raises(FileNotFoundError, match="ファイルが見つかりません"):
-                reader.read_document(file_path)
+        with pytest.raises(FileNotFoundError, match="ファイルが見つかりません"):
+            reader.read_document(file_path)
 
     def test_read_document_サポートされていないファイルタイプを指定した場合_例外が発生すること(
         self,
@@ -269,6 +286,62 @@ class TestFileSystemDocumentReader:
         for i, doc in enumerate(documents):
             assert doc == expected_documents[i]
 
+    def test_read_documents_多数のファイルを指定した場合_入力順のDocumentリストが返されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        reader = FileSystemDocumentReader()
+        temp_dir = tempfile.mkdtemp()
+        file_paths = []
+        for i in range(10):
+            file_path = os.path.join(temp_dir, f"file{i}.txt")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(f"Content {i}")
+            file_paths.append(file_path)
+
+        try:
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            documents = reader.read_documents(file_paths, temp_dir)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert [doc.file_path for doc in documents] == file_paths
+            assert [doc.content for doc in documents] == [
+                f"Content {i}" for i in range(10)
+            ]
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_read_documents_max_workersに1を指定した場合_スレッドプールを使わずに読み込むこと(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        reader = FileSystemDocumentReader()
+        file_paths = [f"/docs/file{i}.txt" for i in range(5)]
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        with patch.object(reader, "_read_and_check_document") as mock_read:
+            mock_read.side_effect = lambda path, base_directory=None: path
+            with patch(
+                "src.adapter.filesystem_document_reader.ThreadPoolExecutor"
+            ) as mock_executor:
+                documents = reader.read_documents(file_paths, max_workers=1)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert documents == file_paths
+        mock_executor.assert_not_called()
+
     def test_read_documents_空のリストを指定した場合_空のリストが返されること(self):
         # ------------------------------
         # 準備 (Arrange)
@@ -285,3 +358,37 @@ class TestFileSystemDocumentReader:
         # 検証 (Assert)
         # ------------------------------
         assert len(documents) == 0
+
+    def test_move_file_移動元ディレクトリが空になった場合_base_directoryの手前まで空ディレクトリが削除されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        root_dir = tempfile.mkdtemp()
+        try:
+            input_dir = os.path.join(root_dir, "input")
+            done_dir = os.path.join(root_dir, "done")
+            nested_dir = os.path.join(input_dir, "a", "b")
+            os.makedirs(nested_dir)
+            os.makedirs(os.path.join(input_dir, "keep"))
+            source_path = os.path.join(nested_dir, "test.txt")
+            with open(source_path, "w", encoding="utf-8") as f:
+                f.write("テスト内容")
+            reader = FileSystemDocumentReader(base_directory=input_dir)
+
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            moved_path = reader.move_file(source_path, done_dir)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert moved_path == os.path.join(done_dir, "a", "b", "test.txt")
+            assert os.path.exists(moved_path)
+            assert not os.path.exists(os.path.join(input_dir, "a"))
+            assert os.path.isdir(os.path.join(input_dir, "keep"))
+            assert os.path.isdir(input_dir)
+        finally:
+            shutil.rmtree(root_dir)
@@ -0,0 +1,69 @@
+"""logging_utilsのテスト"""
+
+import logging
+import threading
+
+from src.adapter.logging_utils import FileContextFilter, current_file
+
+
+def create_record():
+    """テスト用のログレコードを作成する"""
+    return logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="テスト",
+        args=None,
+        exc_info=None,
+    )
+
+
+class TestFileContextFilter:
+    """FileContextFilterのテスト"""
+
+    def test_filter_ファイルコンテキストがある場合_拡張子を除いた短いファイル名が設定されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        context_filter = FileContextFilter()
+        record = create_record()
+        token = current_file.set("/input/docs/very_long_document_name_sample.tar.gz")
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        try:
+            result = context_filter.filter(record)
+        finally:
+            current_file.reset(token)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert result is True
+        assert record.file_context == "[very_long_document_n]"
+        assert record.thread_name == f"[T{threading.get_ident() % 1000:03d}]"
+
+    def test_filter_ファイルコンテキストがない場合_プレースホルダーが設定されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        context_filter = FileContextFilter()
+        record = create_record()
+        record.thread = None
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        context_filter.filter(record)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert record.file_context == "[--------]"
+        assert record.thread_name == "[T---]"
@@ -320,3 +320,34 @@ class TestDocument:
             assert document.relative_path == "test.txt"
             assert document.file_name == "test.txt"
             assert document.content == "test content"
+
+    def test_Document_from_file_mmap対象サイズ以上の場合_同じ内容が読み込まれること(
+        self, monkeypatch
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        import tempfile
+        import os
+
+        monkeypatch.setattr("src.domain.document.MMAP_MIN_FILE_SIZE", 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            text_file = os.path.join(temp_dir, "large.txt")
+            with open(text_file, "w", encoding="utf-8", newline="") as f:
+                f.write("大きなファイル\r\n2行目")
+            binary_file = os.path.join(temp_dir, "large.pdf")
+            with open(binary_file, "wb") as f:
+                f.write(b"%PDF-1.4\n\xff\xfe\x00binary")
+
+            # ------------------------------
+            # 実行 (Act)
+            # ------------------------------
+            text_document = Document.from_file(text_file)
+            binary_document = Document.from_file(binary_file)
+
+            # ------------------------------
+            # 検証 (Assert)
+            # ------------------------------
+            assert text_document.content == "大きなファイル\n2行目"
+            assert binary_document.content == "<バイナリファイル: large.pdf>"
@@ -1,8 +1,11 @@
 """RegisterDocumentUseCaseのテスト"""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
+from src.adapter.logging_utils import current_file
 from src.usecase.register_document_usecase import RegisterDocumentUseCase
 from src.domain.document import Document
 from src.domain.chunk import Chunk
@@ -39,3 +42,183 @@ class TestRegisterDocumentUseCase:
         assert usecase._file_reader == file_reader
         assert usecase._document_parser == doc_parser
         assert usecase._episode_repository == episode_repository
+
+    @pytest.mark.asyncio
+    async def test_save_episodes_parallel_with_progress_一部のエピソード保存が失敗した場合_失敗件数が返されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        usecase = RegisterDocumentUseCase(
+            file_reader=Mock(),
+            document_parser=Mock(),
+            episode_repository=Mock(),
+            chunk_file_manager=Mock(),
+        )
+
+        async def save_single(file_path, episode_index, episode, total_episodes):
+            if episode_index % 2 == 1:
+                raise RuntimeError("保存失敗")
+
+        usecase._save_single_episode_with_progress = AsyncMock(side_effect=save_single)
+        remaining_episodes = [(i, Mock(name=f"episode_{i}")) for i in range(5)]
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        error_count = await usecase._save_episodes_parallel_with_progress(
+            "/input_work/sample.txt", remaining_episodes, 2, 5
+        )
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert error_count == 2
+        assert usecase._save_single_episode_with_progress.await_count == 5
+
+    def test_extract_source_file_from_episode_対応するドキュメントがない場合_エピソード名のファイル名部分が返されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        usecase = RegisterDocumentUseCase(
+            file_reader=Mock(),
+            document_parser=Mock(),
+            episode_repository=Mock(),
+            chunk_file_manager=Mock(),
+        )
+        episode = Mock()
+        episode.name = "docs/sample.txt - chunk_0"
+        no_separator_episode = Mock()
+        no_separator_episode.name = "sample.txt"
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        source_file = usecase._extract_source_file_from_episode(episode, [])
+        no_separator_source_file = usecase._extract_source_file_from_episode(
+            no_separator_episode, []
+        )
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert source_file == "docs/sample.txt"
+        assert no_separator_source_file == "sample.txt"
+
+    @pytest.mark.asyncio
+    async def test_save_single_episode_with_progress_保存に失敗した場合_ファイルコンテキストが元に戻ること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        episode_repository = Mock()
+        episode_repository.save = AsyncMock(side_effect=RuntimeError("保存失敗"))
+        usecase = RegisterDocumentUseCase(
+            file_reader=Mock(),
+            document_parser=Mock(),
+            episode_repository=episode_repository,
+            chunk_file_manager=Mock(),
+        )
+        episode = Mock()
+        episode.name = "sample.txt - chunk_0"
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        with pytest.raises(RuntimeError):
+            await usecase._save_single_episode_with_progress(
+                "/input_work/sample.txt", 0, episode, 1
+            )
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert current_file.get() is None
+
+    @pytest.mark.asyncio
+    async def test_save_episodes_with_progress_tracking_複数ファイルのエピソードの場合_ファイル別にグループ化して保存されること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        usecase = RegisterDocumentUseCase(
+            file_reader=Mock(),
+            document_parser=Mock(),
+            episode_repository=Mock(),
+            chunk_file_manager=Mock(),
+        )
+        usecase._save_file_episodes_with_progress = AsyncMock()
+        documents = [Mock(file_path="/input/a.txt"), Mock(file_path="/input/b.txt")]
+        episodes = []
+        for name in ["a.txt - chunk_0", "b.txt - chunk_0", "a.txt - chunk_1"]:
+            episode = Mock()
+            episode.name = name
+            episodes.append(episode)
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        result = await usecase._save_episodes_with_progress_tracking(
+            episodes, documents, 2
+        )
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert result is True
+        calls = usecase._save_file_episodes_with_progress.await_args_list
+        assert [(c.args[0], c.args[1]) for c in calls] == [
+            ("/input/a.txt", [episodes[0], episodes[2]]),
+            ("/input/b.txt", [episodes[1]]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_episodes_parallel_with_progress_呼び出し側がキャンセルされた場合_未完了の保存もキャンセルされること(
+        self,
+    ):
+        # ------------------------------
+        # 準備 (Arrange)
+        # ------------------------------
+        usecase = RegisterDocumentUseCase(
+            file_reader=Mock(),
+            document_parser=Mock(),
+            episode_repository=Mock(),
+            chunk_file_manager=Mock(),
+        )
+        started = asyncio.Event()
+        cancelled_indexes = []
+
+        async def save_single(file_path, episode_index, episode, total_episodes):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled_indexes.append(episode_index)
+                raise
+
+        usecase._save_single_episode_with_progress = AsyncMock(side_effect=save_single)
+        remaining_episodes = [(i, Mock(name=f"episode_{i}")) for i in range(3)]
+        caller = asyncio.ensure_future(
+            usecase._save_episodes_parallel_with_progress(
+                "/input_work/sample.txt", remaining_episodes, 3, 3
+            )
+        )
+        await started.wait()
+
+        # ------------------------------
+        # 実行 (Act)
+        # ------------------------------
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        # ------------------------------
+        # 検証 (Assert)
+        # ------------------------------
+        assert sorted(cancelled_indexes) == [0, 1, 2]